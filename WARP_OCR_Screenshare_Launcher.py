@@ -7,21 +7,356 @@ Auto-installs dependencies and provides one-click OCR screenshare functionality
 
 import os
 import sys
+import codecs
 import subprocess
 import json
 import time
+import queue
 import threading
-import signal
+import shutil
+import atexit
+import importlib.util
+import concurrent.futures
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Tuple
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-from datetime import datetime
-import webbrowser
+from tkinter import ttk, messagebox
+
+# Dependency configuration
+DEPENDENCIES = {
+    'system': {
+        'tesseract-ocr': 'OCR engine',
+        'tesseract-ocr-eng': 'Fast English OCR model',
+        'python3-tk': 'GUI framework', 
+        'python3-pip': 'Python package manager',
+        'python3-venv': 'Virtual environments',
+        'git': 'Version control'
+    },
+    'python': {
+        'pytesseract': 'OCR Python wrapper',
+        'pillow': 'Image processing',
+        'mss': 'Screen capture',
+        'psutil': 'Process management',
+        'requests': 'HTTP requests',
+        'PyQt5': 'Advanced GUI framework'
+    },
+    'optional': {
+        'ollama': 'Local LLM server',
+        'curl': 'HTTP client'
+    }
+}
+
+# pip package name -> importable module name
+PKG_TO_MOD = {
+    'pytesseract': 'pytesseract',
+    'pillow': 'PIL',
+    'mss': 'mss',
+    'psutil': 'psutil',
+    'requests': 'requests',
+    'PyQt5': 'PyQt5'
+}
+
+# OCR Services configuration
+OCR_SERVICES = {
+    'llm_assistant': {
+        'name': 'Discord LLM Assistant',
+        'script': 'discord_llm_assistant.py',
+        'description': 'AI-powered real-time analysis',
+        'auto_start': True,
+        'icon': '🤖'
+    },
+    'overlay': {
+        'name': 'Visual OCR Overlay', 
+        'script': 'discord_screenshare_ocr_overlay.py',
+        'description': 'Transparent text overlay',
+        'auto_start': False,
+        'icon': '🎥'
+    },
+    'bridge': {
+        'name': 'OCR Bridge Service',
+        'script': 'llm_ocr_bridge.py', 
+        'description': 'Core OCR processing',
+        'auto_start': True,
+        'icon': '🌉'
+    }
+}
+
+# TERM_PROGRAM values reported by WARP terminal sessions
+WARP_TERM_PROGRAMS = frozenset({'WarpTerminal'})
+
+# Launcher cache directory
+CACHE_DIR = Path.home() / '.cache' / 'warp-ocr-launcher'
+
+# On-disk memo of the WARP CLI probe, keyed on the binary's path and mtime
+WARP_CLI_CACHE_FILE = CACHE_DIR / 'warp-cli.json'
+
+# Marker written when every dependency was found; trusted while it is newer
+# than the dpkg status database and was written for the same inputs
+DEPS_OK_MARKER = CACHE_DIR / 'deps-ok'
+
+# Tk can watch pipes directly from its event loop on Unix
+USE_TK_FILEHANDLER = sys.platform != 'win32'
+
+# Screenshare module location
+MODULE_PATH = Path(__file__).parent.resolve()
+
+# Example commands shown in the WARP tab
+_WARP_EXAMPLE_COMMANDS_TEMPLATE = """# WARP OCR Screenshare Commands
+
+# Start complete OCR system
+python3 '{module_path}/WARP_OCR_Screenshare_Launcher.py'
+
+# Quick start LLM assistant
+./start_discord_ai.sh
+
+# Visual overlay only
+python3 discord_screenshare_ocr_overlay.py
+
+# Background service management
+python3 /home/nike/personal-enhancement-systems/discord_ocr_service.py --status
+
+# Create WARP alias (add to ~/.zshrc or ~/.bashrc)
+alias ocr-screenshare="python3 '{module_path}/WARP_OCR_Screenshare_Launcher.py'"
+"""
+
+# Shared pool for dependency probes and background installs, reused across calls
+_PROBE_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+atexit.register(_PROBE_POOL.shutdown)
+
+
+def run_logged(cmd: List[str], log: Callable[[str], None] = print) -> int:
+    """Run a command, streaming its output to the log; raise on failure"""
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                               text=True, errors='replace')
+    for line in process.stdout:
+        if line.strip():
+            log(f"   {line.rstrip()}")
+            
+    return_code = process.wait()
+    if return_code != 0:
+        raise subprocess.CalledProcessError(return_code, cmd)
+    return return_code
+
+
+def install_dependencies(dependencies: Dict[str, Dict[str, str]] = DEPENDENCIES,
+                         log: Callable[[str], None] = print,
+                         progress: Callable[[float], None] = lambda value: None):
+    """Install all system and Python dependencies (raises CalledProcessError on apt failure)"""
+    log("🚀 Installing all dependencies...")
+    progress(5)
+    
+    # Update package lists in the background while the install arguments are prepared
+    log("📦 Updating package lists...")
+    apt_update = _PROBE_POOL.submit(run_logged, ['sudo', 'apt', 'update'], log)
+    
+    sys_packages = list(dependencies['system'].keys())
+    py_packages = list(dependencies['python'].keys())
+    
+    apt_update.result()
+    progress(20)
+    
+    # Install system packages first: they provide python3-pip
+    log("🔧 Installing system packages...")
+    run_logged(['sudo', 'apt', 'install', '-y'] + sys_packages, log)
+    progress(60)
+    
+    # Install all Python packages in a single pip invocation
+    log("🐍 Installing Python packages...")
+    
+    try:
+        run_logged([sys.executable, '-m', 'pip', 'install',
+                    '--break-system-packages'] + py_packages, log)
+        log(f"✅ Installed {', '.join(py_packages)}")
+    except subprocess.CalledProcessError as e:
+        log(f"⚠️ Failed to install Python packages: {e}")
+    progress(100)
+    
+    log("🎉 Dependency installation completed!")
+
+
+def dpkg_status_mtime() -> Optional[int]:
+    """Modification time of the dpkg status database, or None if absent"""
+    try:
+        return os.stat('/var/lib/dpkg/status').st_mtime_ns
+    except OSError:
+        return None
+
+
+def dependency_cache_key() -> tuple:
+    """Build the memoization key for dependency check results"""
+    return (dpkg_status_mtime(), tuple(sys.path))
+
+
+# python-apt module (imported on first use; False if unavailable), its package
+# cache and the dpkg state it was opened against
+_apt = None
+_apt_cache = None
+_apt_cache_mtime = None
+
+
+def get_apt_cache():
+    """Open the python-apt cache once, reopening only when dpkg state changes (None without python-apt)"""
+    global _apt, _apt_cache, _apt_cache_mtime
+    
+    # python-apt is slow to import, so only pay for it when packages are queried
+    if _apt is None:
+        try:
+            import apt
+            _apt = apt
+        except ImportError:
+            _apt = False
+    if _apt is False:
+        return None
+        
+    mtime = dpkg_status_mtime()
+    if _apt_cache is None or mtime != _apt_cache_mtime:
+        _apt_cache = _apt.Cache()
+        _apt_cache_mtime = mtime
+    return _apt_cache
+
+
+def query_system_packages(packages: List[str]) -> Dict[str, bool]:
+    """Query install status of all system packages without per-package subprocesses"""
+    results = {pkg: False for pkg in packages}
+    
+    # In-memory apt cache answers without spawning anything
+    try:
+        cache = get_apt_cache()
+        if cache is not None:
+            for pkg in packages:
+                results[pkg] = pkg in cache and cache[pkg].is_installed
+            return results
+    except Exception:
+        pass
+            
+    try:
+        # dpkg-query exits non-zero if any package is unknown but still
+        # prints status lines for the ones it knows about
+        result = subprocess.run(['dpkg-query', '-W', '-f', '${Package}\t${Status}\n'] + packages,
+                              capture_output=True, text=True)
+        for line in result.stdout.splitlines():
+            name, _, status = line.partition('\t')
+            if name in results:
+                results[name] = 'install ok installed' in status
+        return results
+    except FileNotFoundError:
+        pass
+        
+    # RPM-based distros: list installed package names once
+    try:
+        result = subprocess.run(['rpm', '-qa', '--qf', '%{NAME}\n'],
+                              capture_output=True, text=True)
+        installed = set(result.stdout.split())
+        for pkg in packages:
+            results[pkg] = pkg in installed
+    except FileNotFoundError:
+        pass
+        
+    return results
+
+
+def deps_marker_content(dependencies: Dict[str, Dict[str, str]]) -> str:
+    """Inputs the deps-ok marker was written for: sys.path and the checked packages"""
+    return json.dumps({
+        'sys_path': sys.path,
+        'system': sorted(dependencies['system']),
+        'python': sorted(dependencies['python'])
+    })
+
+
+def deps_marker_valid(dependencies: Dict[str, Dict[str, str]] = DEPENDENCIES) -> bool:
+    """Whether the deps-ok marker still vouches for the current environment"""
+    try:
+        marker_stat = DEPS_OK_MARKER.stat()
+        if DEPS_OK_MARKER.read_text() != deps_marker_content(dependencies):
+            return False
+    except OSError:
+        return False
+        
+    dpkg_mtime = dpkg_status_mtime()
+    return dpkg_mtime is None or marker_stat.st_mtime_ns > dpkg_mtime
+
+
+def check_dependencies(dependencies: Dict[str, Dict[str, str]] = DEPENDENCIES,
+                       log: Callable[[str], None] = print) -> Tuple[Dict[str, bool], Dict[str, bool]]:
+    """Probe system and Python dependencies, returning (system, python) install maps"""
+    if deps_marker_valid(dependencies):
+        log("✅ All dependencies are installed")
+        return ({pkg: True for pkg in dependencies['system']},
+                {pkg: True for pkg in dependencies['python']})
+                
+    sys_results = query_system_packages(list(dependencies['system'].keys()))
+    
+    # Already-imported modules need no lookup; resolve the rest on sys.path
+    # concurrently without executing them
+    py_modules = {pkg: PKG_TO_MOD.get(pkg, pkg) for pkg in dependencies['python']}
+    futures = {pkg: _PROBE_POOL.submit(importlib.util.find_spec, module_name)
+               for pkg, module_name in py_modules.items() if module_name not in sys.modules}
+    py_results = {pkg: pkg not in futures or futures[pkg].result() is not None
+                  for pkg in py_modules}
+    
+    missing = {pkg for pkg, ok in sys_results.items() if not ok} | {pkg for pkg, ok in py_results.items() if not ok}
+    try:
+        if missing:
+            DEPS_OK_MARKER.unlink(missing_ok=True)
+        else:
+            DEPS_OK_MARKER.parent.mkdir(parents=True, exist_ok=True)
+            DEPS_OK_MARKER.write_text(deps_marker_content(dependencies))
+    except OSError:
+        pass
+        
+    if missing:
+        log(f"⚠️ Missing: {len(missing)} dependencies")
+    else:
+        log("✅ All dependencies are installed")
+        
+    return sys_results, py_results
+
+
+def build_service_command(script_path: Path) -> List[str]:
+    """Command line used to launch a service script"""
+    if script_path.suffix == '.sh':
+        return ['/bin/bash', str(script_path)]
+    return [sys.executable, str(script_path)]
+
+
+def start_services(services: Dict[str, Dict[str, Any]] = OCR_SERVICES,
+                   module_path: Path = MODULE_PATH,
+                   log: Callable[[str], None] = print,
+                   service_ids: Optional[List[str]] = None,
+                   **popen_kwargs) -> Dict[str, subprocess.Popen]:
+    """Start services concurrently (default: all auto-start ones), passing extra Popen arguments"""
+    # Only the Popen calls run on the pool, so ``log`` must be thread-safe
+    def start(service_id: str) -> Optional[subprocess.Popen]:
+        service_info = services[service_id]
+        script_path = module_path / service_info['script']
+        
+        if not script_path.exists():
+            log(f"❌ Script not found: {script_path}")
+            return None
+            
+        try:
+            process = subprocess.Popen(build_service_command(script_path),
+                                       cwd=module_path, **popen_kwargs)
+            log(f"✅ {service_info['name']} started (PID: {process.pid})")
+            return process
+        except OSError as e:
+            log(f"❌ Failed to start {service_info['name']}: {e}")
+            return None
+            
+    if service_ids is None:
+        service_ids = [service_id for service_id, service_info in services.items()
+                       if service_info.get('auto_start', True)]
+    processes = dict(zip(service_ids, _PROBE_POOL.map(start, service_ids)))
+    return {service_id: process for service_id, process in processes.items() if process is not None}
+
 
 class WARPOCRLauncher:
     """WARP-integrated OCR Screenshare launcher with dependency management"""
     
+    # WARP CLI availability doesn't change during a session
+    _warp_cli_cache: Optional[bool] = None
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("WARP OCR Screenshare Launcher")
@@ -29,61 +364,34 @@ class WARPOCRLauncher:
         self.root.resizable(True, True)
         
         # Current directory (Screenshare module location)
-        self.module_path = Path(__file__).parent.resolve()
+        self.module_path = MODULE_PATH
         self.home_path = Path.home()
         
         # Dependency configuration
-        self.dependencies = {
-            'system': {
-                'tesseract-ocr': 'OCR engine',
-                'python3-tk': 'GUI framework', 
-                'python3-pip': 'Python package manager',
-                'python3-venv': 'Virtual environments',
-                'git': 'Version control'
-            },
-            'python': {
-                'pytesseract': 'OCR Python wrapper',
-                'pillow': 'Image processing',
-                'mss': 'Screen capture',
-                'psutil': 'Process management',
-                'requests': 'HTTP requests',
-                'PyQt5': 'Advanced GUI framework'
-            },
-            'optional': {
-                'ollama': 'Local LLM server',
-                'curl': 'HTTP client'
-            }
-        }
+        self.dependencies = DEPENDENCIES
         
-        # OCR Services configuration
-        self.ocr_services = {
-            'llm_assistant': {
-                'name': 'Discord LLM Assistant',
-                'script': 'discord_llm_assistant.py',
-                'description': 'AI-powered real-time analysis',
-                'auto_start': True,
-                'icon': '🤖'
-            },
-            'overlay': {
-                'name': 'Visual OCR Overlay', 
-                'script': 'discord_screenshare_ocr_overlay.py',
-                'description': 'Transparent text overlay',
-                'auto_start': False,
-                'icon': '🎥'
-            },
-            'bridge': {
-                'name': 'OCR Bridge Service',
-                'script': 'llm_ocr_bridge.py', 
-                'description': 'Core OCR processing',
-                'auto_start': True,
-                'icon': '🌉'
-            }
-        }
+        # OCR Services configuration (per-instance copy, annotated with resolved paths)
+        self.ocr_services = {service_id: dict(service_info)
+                             for service_id, service_info in OCR_SERVICES.items()}
+        
+        # Resolve script paths once; start_service reuses them on every launch
+        for service_info in self.ocr_services.values():
+            script_path = self.module_path / service_info['script']
+            service_info['_path'] = script_path
+            service_info['_exists'] = script_path.exists()
+            
+        self._launcher_cmd = f"python3 '{self.module_path / 'WARP_OCR_Screenshare_Launcher.py'}'"
         
         # Running processes
         self.processes = {}
         self.running_services = set()
         
+        # Log entries queued by any thread, flushed to the GUI on a timer
+        self._log_queue = queue.Queue()
+        
+        # Dependency check results keyed on (dpkg status mtime, sys.path)
+        self._dep_cache: Dict[tuple, Dict[str, Dict[str, bool]]] = {}
+        
         # Setup GUI
         self.setup_gui()
         self.check_warp_integration()
@@ -207,10 +515,25 @@ class WARPOCRLauncher:
                               command=self.check_dependencies)
         check_btn.pack(pady=5)
         
-        # Dependencies display
+        # Dependencies display: rows are built once and updated in place by checks
         self.deps_display = ttk.Frame(parent)
         self.deps_display.pack(fill='both', expand=True, padx=20, pady=10)
         
+        self._dep_row_labels = {}
+        for category, frame_title in (('system', "System Packages"), ('python', "Python Packages")):
+            category_frame = ttk.LabelFrame(self.deps_display, text=frame_title, padding=5)
+            category_frame.pack(fill='x', pady=5)
+            
+            for pkg, desc in self.dependencies[category].items():
+                pkg_frame = ttk.Frame(category_frame)
+                pkg_frame.pack(fill='x')
+                
+                name_label = ttk.Label(pkg_frame, text=f"{pkg} ({desc})")
+                name_label.pack(side='left')
+                status_label = ttk.Label(pkg_frame, text="⚪ Not checked", foreground='gray')
+                status_label.pack(side='right')
+                self._dep_row_labels[pkg] = (name_label, status_label)
+        
         # Progress bar
         self.progress_var = tk.DoubleVar()
         self.progress_bar = ttk.Progressbar(parent, variable=self.progress_var, 
@@ -219,6 +542,8 @@ class WARPOCRLauncher:
         
     def setup_warp_tab(self, parent):
         """Setup WARP integration tab"""
+        from tkinter import scrolledtext
+        
         # Title
         title_label = ttk.Label(parent, text="⚡ WARP Terminal Integration", 
                                font=('Arial', 16, 'bold'))
@@ -240,7 +565,7 @@ class WARPOCRLauncher:
             ("🔗 Register with WARP", self.register_with_warp, "Add OCR to WARP command palette"),
             ("🖥️ Create WARP Alias", self.create_warp_alias, "Create 'ocr-screenshare' command"),
             ("📋 Copy WARP Command", self.copy_warp_command, "Copy command for WARP terminal"),
-            ("🌐 Open WARP Docs", lambda: webbrowser.open("https://docs.warp.dev"), "WARP documentation")
+            ("🌐 Open WARP Docs", self.open_warp_docs, "WARP documentation")
         ]
         
         for text, command, desc in integration_buttons:
@@ -261,27 +586,12 @@ class WARPOCRLauncher:
         self.warp_commands.pack(fill='both', expand=True)
         
         # Populate with example commands
-        example_commands = """# WARP OCR Screenshare Commands
-
-# Start complete OCR system
-python3 /media/nike/5f57e86a-891a-4785-b1c8-fae01ada4edd1/Modular\\ Deepdive/Screenshare/WARP_OCR_Screenshare_Launcher.py
-
-# Quick start LLM assistant
-./start_discord_ai.sh
-
-# Visual overlay only
-python3 discord_screenshare_ocr_overlay.py
-
-# Background service management
-python3 /home/nike/personal-enhancement-systems/discord_ocr_service.py --status
-
-# Create WARP alias (add to ~/.zshrc or ~/.bashrc)
-alias ocr-screenshare="python3 /media/nike/5f57e86a-891a-4785-b1c8-fae01ada4edd1/Modular\\ Deepdive/Screenshare/WARP_OCR_Screenshare_Launcher.py"
-"""
-        self.warp_commands.insert(tk.END, example_commands)
+        self.warp_commands.insert(tk.END, _WARP_EXAMPLE_COMMANDS_TEMPLATE.format(module_path=self.module_path))
         
     def setup_log_tab(self, parent):
         """Setup logging tab"""
+        from tkinter import scrolledtext
+        
         # Title
         title_label = ttk.Label(parent, text="📋 System Logs", 
                                font=('Arial', 16, 'bold'))
@@ -311,18 +621,38 @@ alias ocr-screenshare="python3 /media/nike/5f57e86a-891a-4785-b1c8-fae01ada4edd1
         self.log_message("💡 Use the Dependencies tab to install required packages")
         self.log_message("💡 Use the Launch tab to start OCR services")
         
-    def log_message(self, message: str):
-        """Log message to GUI and console"""
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        log_entry = f"[{timestamp}] {message}\n"
-        
-        self.log_text.insert(tk.END, log_entry)
+        self._drain_log()
         
-        if self.auto_scroll_var.get():
-            self.log_text.see(tk.END)
+    def log_message(self, message: str):
+        """Log message to GUI and console (safe to call from any thread)"""
+        self._log_queue.put((time.time(), message))
         
-        self.root.update()
-        print(log_entry.strip())
+    def _drain_log(self, max_batch: int = 500):
+        """Flush queued log entries into the log view and console in a single write"""
+        lines = []
+        last_second = None
+        try:
+            while len(lines) < max_batch:
+                timestamp, message = self._log_queue.get_nowait()
+                
+                # Entries in a batch share a handful of seconds; format each once
+                second = int(timestamp)
+                if second != last_second:
+                    last_second = second
+                    time_str = time.strftime('%H:%M:%S', time.localtime(second))
+                lines.append(f"[{time_str}] {message}")
+        except queue.Empty:
+            pass
+            
+        if lines:
+            batch = "\n".join(lines)
+            self.log_text.insert(tk.END, batch + "\n")
+            
+            if self.auto_scroll_var.get():
+                self.log_text.see(tk.END)
+            print(batch)
+                
+        self.root.after(50, self._drain_log)
         
     def clear_logs(self):
         """Clear log display"""
@@ -330,30 +660,24 @@ alias ocr-screenshare="python3 /media/nike/5f57e86a-891a-4785-b1c8-fae01ada4edd1
         
     def check_warp_integration(self):
         """Check WARP terminal integration status"""
+        # Environment detection is a couple of dict lookups; do it inline
+        if os.environ.get('WARP_SESSION') or os.environ.get('TERM_PROGRAM') in WARP_TERM_PROGRAMS:
+            status = "✅ Running in WARP Terminal"
+            integration_level = "Native"
+        else:
+            status = "⚠️ Not detected in WARP Terminal"
+            integration_level = "External"
+            
+        self.warp_status_var.set(f"{status} ({integration_level}) | 🔍 Checking WARP CLI...")
+        
+        # Only the CLI probe needs a background thread
         def check_thread():
             try:
-                # Check if running in WARP terminal
-                warp_session = os.environ.get('WARP_SESSION')
-                term_program = os.environ.get('TERM_PROGRAM')
-                
-                if warp_session or term_program == 'WarpTerminal':
-                    status = "✅ Running in WARP Terminal"
-                    integration_level = "Native"
-                else:
-                    status = "⚠️ Not detected in WARP Terminal"
-                    integration_level = "External"
-                    
-                # Check WARP CLI availability
-                try:
-                    subprocess.run(['warp', '--version'], check=True, 
-                                 capture_output=True, text=True)
-                    cli_status = "WARP CLI available"
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    cli_status = "WARP CLI not found"
+                cli_status = "WARP CLI available" if self.warp_cli_available() else "WARP CLI not found"
                 
                 final_status = f"{status} ({integration_level}) | {cli_status}"
                 self.root.after(0, lambda: self.warp_status_var.set(final_status))
-                self.root.after(0, lambda: self.log_message(f"WARP Integration: {final_status}"))
+                self.log_message(f"WARP Integration: {final_status}")
                 
             except Exception as e:
                 error_msg = f"❌ WARP check error: {e}"
@@ -361,69 +685,77 @@ alias ocr-screenshare="python3 /media/nike/5f57e86a-891a-4785-b1c8-fae01ada4edd1
                 
         threading.Thread(target=check_thread, daemon=True).start()
         
+    def update_dependency_rows(self, results: Dict[str, bool]):
+        """Refresh the status labels of the prebuilt dependency rows"""
+        for pkg, installed in results.items():
+            _, status_label = self._dep_row_labels[pkg]
+            if installed:
+                status_label.config(text="✅ Installed", foreground="green")
+            else:
+                status_label.config(text="❌ Missing", foreground="red")
+                
+    def warp_cli_available(self) -> bool:
+        """Whether the WARP CLI works; memoized for the process and on disk"""
+        if WARPOCRLauncher._warp_cli_cache is None:
+            WARPOCRLauncher._warp_cli_cache = self._probe_warp_cli()
+        return WARPOCRLauncher._warp_cli_cache
+        
+    def _probe_warp_cli(self) -> bool:
+        """Run 'warp --version' unless a result for the same binary is cached on disk"""
+        warp_bin = shutil.which('warp')
+        if warp_bin is None:
+            return False
+            
+        try:
+            key = {'path': warp_bin, 'mtime_ns': os.stat(warp_bin).st_mtime_ns}
+        except OSError:
+            return False
+            
+        try:
+            cached = json.loads(WARP_CLI_CACHE_FILE.read_text())
+            if cached.get('key') == key:
+                return cached['available']
+        except (OSError, ValueError, KeyError):
+            pass
+            
+        try:
+            subprocess.run([warp_bin, '--version'], check=True, 
+                         capture_output=True, text=True)
+            available = True
+        except (subprocess.CalledProcessError, OSError):
+            available = False
+            
+        try:
+            WARP_CLI_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            WARP_CLI_CACHE_FILE.write_text(json.dumps({'key': key, 'available': available}))
+        except OSError:
+            pass
+            
+        return available
+        
     def check_dependencies(self):
         """Check all dependencies"""
         def check_thread():
             self.log_message("🔍 Checking system dependencies...")
             self.progress_var.set(10)
             
-            # Clear previous display
-            for widget in self.deps_display.winfo_children():
-                widget.destroy()
-            
-            # Check system packages
-            sys_frame = ttk.LabelFrame(self.deps_display, text="System Packages", padding=5)
-            sys_frame.pack(fill='x', pady=5)
-            
-            sys_results = {}
-            for pkg, desc in self.dependencies['system'].items():
-                try:
-                    result = subprocess.run(['dpkg', '-l', pkg], 
-                                          capture_output=True, text=True)
-                    installed = result.returncode == 0
-                    sys_results[pkg] = installed
-                    
-                    status_text = "✅ Installed" if installed else "❌ Missing"
-                    color = "green" if installed else "red"
-                    
-                    pkg_frame = ttk.Frame(sys_frame)
-                    pkg_frame.pack(fill='x')
-                    
-                    ttk.Label(pkg_frame, text=f"{pkg} ({desc})").pack(side='left')
-                    ttk.Label(pkg_frame, text=status_text, foreground=color).pack(side='right')
-                    
-                except Exception:
-                    sys_results[pkg] = False
-                    
+            # Reuse results while neither dpkg state nor sys.path has changed
+            cache_key = dependency_cache_key()
+            cached = self._dep_cache.get(cache_key)
+            if cached is not None:
+                sys_results, py_results = cached['sys'], cached['py']
+            else:
+                sys_results, py_results = check_dependencies(self.dependencies, log=lambda message: None)
+                self._dep_cache[cache_key] = {'sys': sys_results, 'py': py_results}
             self.progress_var.set(50)
             
-            # Check Python packages
-            py_frame = ttk.LabelFrame(self.deps_display, text="Python Packages", padding=5)
-            py_frame.pack(fill='x', pady=5)
-            
-            py_results = {}
-            for pkg, desc in self.dependencies['python'].items():
-                try:
-                    __import__(pkg.replace('-', '_').lower())
-                    py_results[pkg] = True
-                    status_text = "✅ Installed"
-                    color = "green"
-                except ImportError:
-                    py_results[pkg] = False
-                    status_text = "❌ Missing"
-                    color = "red"
-                    
-                pkg_frame = ttk.Frame(py_frame)
-                pkg_frame.pack(fill='x')
-                
-                ttk.Label(pkg_frame, text=f"{pkg} ({desc})").pack(side='left')
-                ttk.Label(pkg_frame, text=status_text, foreground=color).pack(side='right')
-            
+            # Update the prebuilt rows on the Tk thread
+            self.root.after(0, lambda: self.update_dependency_rows({**sys_results, **py_results}))
             self.progress_var.set(100)
             
             # Summary
-            missing_sys = [pkg for pkg, installed in sys_results.items() if not installed]
-            missing_py = [pkg for pkg, installed in py_results.items() if not installed]
+            missing_sys = {pkg for pkg, installed in sys_results.items() if not installed}
+            missing_py = {pkg for pkg, installed in py_results.items() if not installed}
             
             if not missing_sys and not missing_py:
                 self.root.after(0, lambda: self.status_var.set("✅ All dependencies ready"))
@@ -439,41 +771,11 @@ alias ocr-screenshare="python3 /media/nike/5f57e86a-891a-4785-b1c8-fae01ada4edd1
         """Install all missing dependencies"""
         def install_thread():
             try:
-                self.log_message("🚀 Installing all dependencies...")
-                self.progress_var.set(5)
-                
-                # Update package lists
-                self.log_message("📦 Updating package lists...")
-                subprocess.run(['sudo', 'apt', 'update'], check=True, capture_output=True)
-                self.progress_var.set(20)
-                
-                # Install system packages
-                self.log_message("🔧 Installing system packages...")
-                sys_packages = list(self.dependencies['system'].keys())
-                
-                subprocess.run(['sudo', 'apt', 'install', '-y'] + sys_packages, 
-                             check=True, capture_output=True)
-                self.progress_var.set(60)
-                
-                # Install Python packages
-                self.log_message("🐍 Installing Python packages...")
-                py_packages = list(self.dependencies['python'].keys())
-                
-                for pkg in py_packages:
-                    try:
-                        subprocess.run([sys.executable, '-m', 'pip', 'install', 
-                                      '--break-system-packages', pkg], 
-                                     check=True, capture_output=True)
-                        self.log_message(f"✅ Installed {pkg}")
-                    except subprocess.CalledProcessError as e:
-                        self.log_message(f"⚠️ Failed to install {pkg}: {e}")
-                        
-                self.progress_var.set(100)
-                
-                self.log_message("🎉 Dependency installation completed!")
+                install_dependencies(self.dependencies, self.log_message, self.progress_var.set)
                 self.root.after(0, lambda: self.status_var.set("✅ Dependencies installed"))
                 
-                # Auto-check dependencies
+                # Auto-check dependencies against fresh state
+                self._dep_cache.clear()
                 self.root.after(1000, self.check_dependencies)
                 
             except subprocess.CalledProcessError as e:
@@ -490,9 +792,9 @@ alias ocr-screenshare="python3 /media/nike/5f57e86a-891a-4785-b1c8-fae01ada4edd1
             return
             
         service_info = self.ocr_services[service_id]
-        script_path = self.module_path / service_info['script']
+        script_path = service_info['_path']
         
-        if not script_path.exists():
+        if not service_info['_exists']:
             self.log_message(f"❌ Script not found: {script_path}")
             messagebox.showerror("Error", f"Script not found: {service_info['script']}")
             return
@@ -500,29 +802,15 @@ alias ocr-screenshare="python3 /media/nike/5f57e86a-891a-4785-b1c8-fae01ada4edd1
         self.log_message(f"🚀 Starting {service_info['name']}...")
         
         try:
-            # Determine command
-            if script_path.suffix == '.sh':
-                cmd = ['/bin/bash', str(script_path)]
-            else:
-                cmd = [sys.executable, str(script_path)]
-                
             # Start process
             process = subprocess.Popen(
-                cmd,
+                build_service_command(script_path),
                 cwd=self.module_path,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True
+                stderr=subprocess.STDOUT
             )
             
-            self.processes[service_id] = process
-            self.running_services.add(service_id)
-            
-            # Update status
-            self.service_labels[service_id].config(text="🟢 Running", foreground="green")
-            
-            # Monitor output
-            self.monitor_service(service_id, process)
+            self._track_service(service_id, process)
             
             self.log_message(f"✅ {service_info['name']} started (PID: {process.pid})")
             
@@ -539,6 +827,11 @@ alias ocr-screenshare="python3 /media/nike/5f57e86a-891a-4785-b1c8-fae01ada4edd1
         service_info = self.ocr_services[service_id]
         
         try:
+            self._unregister_service_output(process.stdout)
+            
+            # Mark it stopped first so output watchers don't report the exit as a crash
+            self.running_services.discard(service_id)
+            
             if process.poll() is None:
                 self.log_message(f"🛑 Stopping {service_info['name']}...")
                 process.terminate()
@@ -551,8 +844,9 @@ alias ocr-screenshare="python3 /media/nike/5f57e86a-891a-4785-b1c8-fae01ada4edd1
                     
                 self.log_message(f"✅ {service_info['name']} stopped")
                 
+            process.stdout.close()
+            
             del self.processes[service_id]
-            self.running_services.discard(service_id)
             
             # Update status
             self.service_labels[service_id].config(text="⚪ Stopped", foreground="red")
@@ -564,16 +858,31 @@ alias ocr-screenshare="python3 /media/nike/5f57e86a-891a-4785-b1c8-fae01ada4edd1
         """Start all configured OCR services"""
         self.log_message("🎯 Starting complete OCR system...")
         
-        # Start services in order
-        for service_id, service_info in self.ocr_services.items():
-            if service_info.get('auto_start', True):
-                self.start_service(service_id)
-                time.sleep(0.5)  # Brief delay between starts
-                
+        service_ids = [service_id for service_id, service_info in self.ocr_services.items()
+                       if service_info.get('auto_start', True)
+                       and service_id not in self.running_services]
+        
+        # Only the spawns run on the pool; Tk state is updated here on the main thread
+        processes = start_services(self.ocr_services, self.module_path, self.log_message,
+                                   service_ids, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        for service_id, process in processes.items():
+            self._track_service(service_id, process)
+            
         self.status_var.set("✅ OCR System Running")
         self.log_message("🎉 Complete OCR system started!")
         self.log_message("💡 Ready for Discord screenshare")
         
+    def _track_service(self, service_id: str, process: subprocess.Popen):
+        """Record a started service, mark it running and watch its output (main thread)"""
+        self.processes[service_id] = process
+        self.running_services.add(service_id)
+        
+        # Update status
+        self.service_labels[service_id].config(text="🟢 Running", foreground="green")
+        
+        # Monitor output
+        self.monitor_service(service_id, process)
+        
     def stop_all_services(self):
         """Stop all running services"""
         self.log_message("🛑 Stopping all OCR services...")
@@ -586,32 +895,113 @@ alias ocr-screenshare="python3 /media/nike/5f57e86a-891a-4785-b1c8-fae01ada4edd1
         
     def monitor_service(self, service_id: str, process: subprocess.Popen):
         """Monitor service output"""
-        def monitor_thread():
-            service_info = self.ocr_services[service_id]
+        if not USE_TK_FILEHANDLER:
+            # Windows can't select() on pipes; a daemon thread per service blocks on readline
+            threading.Thread(target=self._pump_service_output, args=(service_id, process),
+                             daemon=True).start()
+            return
             
-            try:
-                while process.poll() is None:
-                    output = process.stdout.readline()
-                    if output:
-                        self.root.after(0, lambda msg=output.strip(): 
-                                       self.log_message(f"[{service_info['name']}] {msg}"))
-                        
-                # Process ended
-                return_code = process.poll()
-                self.root.after(0, lambda: self.log_message(
-                    f"🔴 {service_info['name']} ended (exit: {return_code})"))
+        os.set_blocking(process.stdout.fileno(), False)
+        
+        # Per-service read state; the incremental decoder keeps multi-byte
+        # characters split across reads intact
+        state = {
+            'service_id': service_id,
+            'process': process,
+            'fileobj': process.stdout,
+            'decoder': codecs.getincrementaldecoder('utf-8')('replace'),
+            'buffer': ''
+        }
+        
+        # Tk watches the pipe from its own event loop; no Python thread needed.
+        # Tcl calls must come from the main thread, so hop there if necessary.
+        def register():
+            self.root.tk.createfilehandler(process.stdout, tk.READABLE,
+                                           lambda fileobj, mask: self._on_service_output(state))
+                                           
+        if threading.current_thread() is threading.main_thread():
+            register()
+        else:
+            self.root.after(0, register)
+            
+    def _pump_service_output(self, service_id: str, process: subprocess.Popen):
+        """Forward one service's output lines to the log queue until EOF (Windows)"""
+        service_info = self.ocr_services[service_id]
+        
+        try:
+            for raw_line in iter(process.stdout.readline, b''):
+                line = raw_line.decode('utf-8', 'replace').strip()
+                if line:
+                    self.log_message(f"[{service_info['name']}] {line}")
+        except ValueError:
+            return  # stop_service closed the pipe
+        except OSError as e:
+            self.log_message(f"❌ Monitor error for {service_info['name']}: {e}")
+            return
+            
+        # Off the Tk thread, so waiting for the exit code is fine here
+        self._report_service_exit(service_id, process.wait())
+        
+    def _on_service_output(self, state: Dict[str, Any]):
+        """Handle a readable service pipe, reporting read errors"""
+        try:
+            self._read_service_output(state)
+        except Exception as e:
+            service_info = self.ocr_services[state['service_id']]
+            self.log_message(f"❌ Monitor error for {service_info['name']}: {e}")
+            self._unregister_service_output(state['fileobj'])
+            
+    def _read_service_output(self, state: Dict[str, Any]):
+        """Read available output for one service, handling EOF"""
+        service_id = state['service_id']
+        service_info = self.ocr_services[service_id]
+        
+        try:
+            data = os.read(state['fileobj'].fileno(), 8192)
+        except BlockingIOError:
+            return
+            
+        if data:
+            state['buffer'] += state['decoder'].decode(data)
+            *lines, state['buffer'] = state['buffer'].split('\n')
+            for line in lines:
+                if line.strip():
+                    self.log_message(f"[{service_info['name']}] {line.strip()}")
+            return
+            
+        # EOF: flush the partial line and report the exit
+        self._unregister_service_output(state['fileobj'])
+        
+        buffer = state['buffer'] + state['decoder'].decode(b'', final=True)
+        if buffer.strip():
+            self.log_message(f"[{service_info['name']}] {buffer.strip()}")
+            
+        # EOF usually means the process exited, but it may not be reaped yet;
+        # never block the Tk thread waiting for it
+        self._report_service_exit(service_id, state['process'].poll())
+        
+    def _report_service_exit(self, service_id: str, return_code: Optional[int]):
+        """Log a service's exit and mark it stopped unless stop_service already did"""
+        service_info = self.ocr_services[service_id]
+        exit_status = 'unknown' if return_code is None else return_code
+        self.log_message(f"🔴 {service_info['name']} ended (exit: {exit_status})")
+        
+        # Update status
+        if service_id in self.running_services:
+            self.running_services.discard(service_id)
+            self.root.after(0, lambda: self.service_labels[service_id].config(
+                text="🔴 Stopped", foreground="red"))
                 
-                # Update status
-                if service_id in self.running_services:
-                    self.running_services.discard(service_id)
-                    self.root.after(0, lambda: self.service_labels[service_id].config(
-                        text="🔴 Stopped", foreground="red"))
-                        
-            except Exception as e:
-                self.root.after(0, lambda: self.log_message(
-                    f"❌ Monitor error for {service_info['name']}: {e}"))
-                    
-        threading.Thread(target=monitor_thread, daemon=True).start()
+    def _unregister_service_output(self, fileobj):
+        """Stop watching a service pipe (no-op if already unregistered)"""
+        # Reader threads on Windows stop by themselves at EOF
+        if USE_TK_FILEHANDLER:
+            self.root.tk.deletefilehandler(fileobj)
+            
+    def open_warp_docs(self):
+        """Open WARP documentation in the browser"""
+        import webbrowser
+        webbrowser.open("https://docs.warp.dev")
         
     def register_with_warp(self):
         """Register OCR system with WARP"""
@@ -621,7 +1011,7 @@ alias ocr-screenshare="python3 /media/nike/5f57e86a-891a-4785-b1c8-fae01ada4edd1
         warp_config = {
             "name": "OCR Screenshare",
             "description": "Real-time OCR analysis for Discord screenshare",
-            "command": f"python3 {self.module_path / 'WARP_OCR_Screenshare_Launcher.py'}",
+            "command": self._launcher_cmd,
             "icon": "🎥",
             "tags": ["ocr", "discord", "screenshare", "ai"]
         }
@@ -631,7 +1021,7 @@ alias ocr-screenshare="python3 /media/nike/5f57e86a-891a-4785-b1c8-fae01ada4edd1
         
     def create_warp_alias(self):
         """Create WARP shell alias"""
-        alias_command = f"alias ocr-screenshare=\"python3 '{self.module_path / 'WARP_OCR_Screenshare_Launcher.py'}'\""
+        alias_command = f"alias ocr-screenshare=\"{self._launcher_cmd}\""
         
         # Copy to clipboard if possible
         try:
@@ -650,7 +1040,7 @@ alias ocr-screenshare="python3 /media/nike/5f57e86a-891a-4785-b1c8-fae01ada4edd1
             
     def copy_warp_command(self):
         """Copy WARP command to clipboard"""
-        command = f"python3 '{self.module_path / 'WARP_OCR_Screenshare_Launcher.py'}'"
+        command = self._launcher_cmd
         
         try:
             import pyperclip
@@ -683,14 +1073,25 @@ def main():
     # Handle command line arguments
     if len(sys.argv) > 1:
         if sys.argv[1] == '--install-deps':
-            print("🚀 Installing dependencies...")
-            launcher = WARPOCRLauncher()
-            launcher.install_all_dependencies()
+            # CLI path: no Tk window needed
+            try:
+                install_dependencies()
+            except subprocess.CalledProcessError as e:
+                print(f"❌ Installation error: {e}")
+                sys.exit(1)
             return
         elif sys.argv[1] == '--start-all':
             print("🎯 Starting all OCR services...")
-            launcher = WARPOCRLauncher()
-            launcher.start_all_services()
+            processes = start_services()
+            
+            # Keep the services attached to this terminal until they exit or Ctrl+C
+            try:
+                for process in processes.values():
+                    process.wait()
+            except KeyboardInterrupt:
+                for process in processes.values():
+                    process.terminate()
+                print("\n👋 OCR services stopped")
             return
             
     # Run GUI launcher
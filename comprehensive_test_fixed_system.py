@@ -4,25 +4,67 @@ Comprehensive Integration Test for Fixed Ollama System
 Tests all components and verifies fixes are working properly
 """
 
+import io
+import os
 import sys
+import asyncio
+import compileall
+import importlib
+import importlib.util
+import py_compile
 import time
-import subprocess
 import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Protocol, runtime_checkable
 
-# Add current directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Directory holding this script and the modules it exercises
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Screenshare module directory the launcher imports Ollama components from
+SCREENSHARE_DIR = "/media/nike/5f57e86a-891a-4785-b1c8-fae01ada4edd1/Modular Deepdive/Screenshare"
+
+# Shared HTTP session for Ollama checks, created on first use
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def get_session():
+    """Return the shared requests.Session with a pooled HTTPAdapter"""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            _SESSION = requests.Session()
+            _SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=20,
+                                                  max_retries=Retry(total=2, backoff_factor=0.2)))
+        return _SESSION
+
+async def run_subprocess(argv, timeout, cwd=None):
+    """Run a command without blocking the event loop; returns (returncode, stdout, stderr)"""
+    proc = await asyncio.create_subprocess_exec(
+        *argv, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=cwd)
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
 
 def test_ollama_service():
     """Test if Ollama service is running"""
     print("🔍 Testing Ollama Service...")
     try:
-        import requests
-        response = requests.get("http://localhost:11434/api/version", timeout=5)
+        session = get_session()
+        response = session.get("http://localhost:11434/api/version", timeout=5)
         if response.status_code == 200:
             print("  ✅ Ollama service is running")
             # Test models
-            models_response = requests.get("http://localhost:11434/api/tags", timeout=5)
+            models_response = session.get("http://localhost:11434/api/tags", timeout=5)
             if models_response.status_code == 200:
                 models = models_response.json()
                 model_count = len(models.get('models', []))
@@ -35,6 +77,13 @@ def test_ollama_service():
         print(f"  ❌ Ollama service error: {e}")
         return False
 
+def module_available(module):
+    """Check that a module can be located without executing it"""
+    try:
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
+
 def test_imports():
     """Test all module imports"""
     print("🔍 Testing Module Imports...")
@@ -46,14 +95,19 @@ def test_imports():
         "demo_ollama_system"
     ]
     
+    # Resolve specs only: executing the modules would run their GUI/Ollama
+    # setup, which the other tests already exercise. Use importlib.import_module
+    # here instead if a check ever needs the module's top-level code to run.
+    with ThreadPoolExecutor(max_workers=len(modules_to_test)) as executor:
+        found = list(executor.map(module_available, modules_to_test))
+    
     passed = 0
-    for module in modules_to_test:
-        try:
-            __import__(module)
+    for module, available in zip(modules_to_test, found):
+        if available:
             print(f"  ✅ {module}")
             passed += 1
-        except ImportError as e:
-            print(f"  ❌ {module}: {e}")
+        else:
+            print(f"  ❌ {module}: module not found")
     
     print(f"  📊 Import tests: {passed}/{len(modules_to_test)} passed")
     return passed == len(modules_to_test)
@@ -88,6 +142,12 @@ def test_prompt_system_robustness():
         print(f"  ❌ Prompt system error: {e}")
         return False
 
+@runtime_checkable
+class ShutdownCapable(Protocol):
+    """GUI component with a window-close handler"""
+    
+    def on_closing(self) -> None: ...
+
 def test_gui_components_safe():
     """Test GUI components without launching windows"""
     print("🔍 Testing GUI Components (Safe Mode)...")
@@ -100,15 +160,21 @@ def test_gui_components_safe():
         interface = OllamaInteractionInterface()
         assistant = EnhancedOCRAssistant()
         
-        print("  ✅ GUI components instantiated successfully")
-        
-        # Test that they have proper error handling
-        if hasattr(interface, 'on_closing') and hasattr(assistant, 'on_closing'):
-            print("  ✅ Proper shutdown handlers present")
-            return True
-        else:
-            print("  ⚠️ Some shutdown handlers missing")
-            return False
+        try:
+            print("  ✅ GUI components instantiated successfully")
+            
+            # Test that they have proper error handling
+            if isinstance(interface, ShutdownCapable) and isinstance(assistant, ShutdownCapable):
+                print("  ✅ Proper shutdown handlers present")
+                return True
+            else:
+                print("  ⚠️ Some shutdown handlers missing")
+                return False
+        finally:
+            # Tcl interpreters must be torn down on the thread that created them
+            for component in (interface, assistant):
+                if getattr(component, 'root', None) is not None:
+                    component.root.destroy()
             
     except Exception as e:
         print(f"  ❌ GUI component error: {e}")
@@ -126,38 +192,31 @@ def test_launcher_imports():
             return False
             
         # Run a quick syntax check
-        result = subprocess.run([
-            sys.executable, "-m", "py_compile", launcher_path
-        ], capture_output=True, text=True, timeout=10)
-        
-        if result.returncode == 0:
+        try:
+            py_compile.compile(launcher_path, doraise=True)
             print("  ✅ Launcher syntax is valid")
-        else:
-            print(f"  ❌ Launcher syntax error: {result.stderr}")
+        except py_compile.PyCompileError as e:
+            print(f"  ❌ Launcher syntax error: {e.msg}")
             return False
             
-        # Test imports specifically
-        test_script = f"""
-import sys
-sys.path.insert(0, "/media/nike/5f57e86a-891a-4785-b1c8-fae01ada4edd1/Modular Deepdive/Screenshare")
-try:
-    from ollama_prompt_system import OllamaPromptSystem
-    from ollama_interaction import OllamaInteractionInterface  
-    from ocr_llm_assistant_enhanced import EnhancedOCRAssistant
-    print("OLLAMA_IMPORTS_SUCCESS")
-except ImportError as e:
-    print(f"OLLAMA_IMPORTS_FAILED: {{e}}")
-"""
-        
-        result = subprocess.run([
-            sys.executable, "-c", test_script
-        ], capture_output=True, text=True, timeout=10)
+        # Test imports specifically, from the launcher's module directory
+        if SCREENSHARE_DIR not in sys.path:
+            sys.path.insert(0, SCREENSHARE_DIR)
+        importlib.invalidate_caches()
         
-        if "OLLAMA_IMPORTS_SUCCESS" in result.stdout:
+        components = [
+            ("ollama_prompt_system", "OllamaPromptSystem"),
+            ("ollama_interaction", "OllamaInteractionInterface"),
+            ("ocr_llm_assistant_enhanced", "EnhancedOCRAssistant")
+        ]
+        try:
+            for module_name, class_name in components:
+                if not hasattr(importlib.import_module(module_name), class_name):
+                    raise ImportError(f"cannot import name '{class_name}' from '{module_name}'")
             print("  ✅ Launcher can import Ollama components")
             return True
-        else:
-            print(f"  ❌ Launcher import error: {result.stdout}{result.stderr}")
+        except ImportError as e:
+            print(f"  ❌ Launcher import error: {e}")
             return False
             
     except Exception as e:
@@ -168,36 +227,70 @@ def test_startup_script():
     """Test the startup script functionality"""
     print("🔍 Testing Startup Script...")
     try:
-        startup_path = Path(__file__).parent / "ollama_startup.py"
+        startup_path = Path(_HERE) / "ollama_startup.py"
         
         if not startup_path.exists():
             print(f"  ❌ Startup script not found")
             return False
             
         # Test startup script help/status
-        result = subprocess.run([
-            sys.executable, str(startup_path)
-        ], capture_output=True, text=True, timeout=15, cwd=str(startup_path.parent))
+        returncode, stdout, stderr = asyncio.run(run_subprocess(
+            [sys.executable, str(startup_path)], timeout=15, cwd=str(startup_path.parent)))
         
-        if result.returncode == 0 and "Ollama service is running" in result.stdout:
+        if returncode == 0 and "Ollama service is running" in stdout:
             print("  ✅ Startup script working")
             return True
         else:
-            print(f"  ❌ Startup script error: {result.stderr}")
+            print(f"  ❌ Startup script error: {stderr}")
             return False
             
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         print("  ⚠️ Startup script timeout (may be launching GUI)")
         return True  # Timeout might mean it's trying to launch GUI, which is expected
     except Exception as e:
         print(f"  ❌ Startup script test error: {e}")
         return False
 
+class ThreadLocalStdout:
+    """stdout proxy that routes each test thread's prints into its own buffer"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+        
+    def write(self, text):
+        return getattr(self.local, 'buffer', self.stream).write(text)
+        
+    def flush(self):
+        getattr(self.local, 'buffer', self.stream).flush()
+        
+    def __getattr__(self, name):
+        # encoding, isatty(), fileno() etc. describe the real stream
+        return getattr(self.stream, name)
+
+def run_buffered_test(test_func, stdout: ThreadLocalStdout):
+    """Run a test with its output captured; returns (success, output)"""
+    stdout.local.buffer = io.StringIO()
+    try:
+        try:
+            success = test_func()
+            status = "✅ PASS" if success else "❌ FAIL"
+            print(f"  Result: {status}")
+        except Exception as e:
+            print(f"  ❌ Test crashed: {e}")
+            success = False
+        return success, stdout.local.buffer.getvalue()
+    finally:
+        del stdout.local.buffer
+
 def run_comprehensive_test():
     """Run all tests and provide summary"""
     print("🧪 Comprehensive Ollama Integration Test Suite")
     print("=" * 60)
     
+    # Byte-compile the suite's modules up front so every import below hits the .pyc cache
+    compileall.compile_dir(_HERE, quiet=1, workers=0)
+    
     tests = [
         ("Ollama Service", test_ollama_service),
         ("Module Imports", test_imports),
@@ -207,18 +300,35 @@ def run_comprehensive_test():
         ("Startup Script", test_startup_script),
     ]
     
+    # Tk roots are bound to the thread that creates them, so GUI tests stay on the main thread
+    main_thread_tests = {"GUI Components (Safe)"}
+    
+    # The other tests share no state, so run them concurrently and report in order
+    stdout = ThreadLocalStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        pooled_tests = [(test_name, test_func) for test_name, test_func in tests
+                        if test_name not in main_thread_tests]
+        with ThreadPoolExecutor(max_workers=len(pooled_tests)) as executor:
+            futures = {executor.submit(run_buffered_test, test_func, stdout): test_name
+                       for test_name, test_func in pooled_tests}
+            outcomes = {futures[future]: future.result() for future in as_completed(futures)}
+            
+        for test_name, test_func in tests:
+            if test_name in main_thread_tests:
+                outcomes[test_name] = run_buffered_test(test_func, stdout)
+    finally:
+        sys.stdout = stdout.stream
+        if _SESSION is not None:
+            _SESSION.close()
+        
     results = []
-    for test_name, test_func in tests:
+    for test_name, _ in tests:
+        success, output = outcomes[test_name]
         print(f"\n{test_name}:")
         print("-" * 40)
-        try:
-            success = test_func()
-            results.append((test_name, success))
-            status = "✅ PASS" if success else "❌ FAIL"
-            print(f"  Result: {status}")
-        except Exception as e:
-            print(f"  ❌ Test crashed: {e}")
-            results.append((test_name, False))
+        print(output, end="")
+        results.append((test_name, success))
     
     # Summary
     print("\n" + "=" * 60)
@@ -246,4 +356,6 @@ def run_comprehensive_test():
         return 1
 
 if __name__ == "__main__":
+    # Make sibling modules importable when run from another directory
+    sys.path.insert(0, _HERE)
     sys.exit(run_comprehensive_test())
\ No newline at end of file
@@ -4,12 +4,17 @@ Demo Script for Ollama Enhanced OCR System
 Demonstrates the key features of the intelligent prompting system
 """
 
+import os
 import sys
 import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-# Add current directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Directory holding this script and the modules it exercises
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+def preview(text: str, limit: int) -> str:
+    """Shorten text for display, slicing only when it is over the limit"""
+    return text if len(text) <= limit else text[:limit] + "..."
 
 def demo_prompt_system():
     """Demonstrate the prompt system with different activity types"""
@@ -50,24 +55,27 @@ def demo_prompt_system():
             }
         ]
         
-        for i, scenario in enumerate(demo_scenarios, 1):
+        # Analyze all scenarios concurrently; results are shown in scenario order
+        with ThreadPoolExecutor(max_workers=len(demo_scenarios)) as executor:
+            futures = [
+                executor.submit(system.analyze_content, scenario['text'], scenario['history'], {
+                    'session_duration': 10.0 + i * 2,
+                    'total_queries': i,
+                    'frames_per_minute': 2.5
+                })
+                for i, scenario in enumerate(demo_scenarios, 1)
+            ]
+            
+        for i, (scenario, future) in enumerate(zip(demo_scenarios, futures), 1):
             print(f"\n🎯 Demo {i}: {scenario['name']}")
             print("-" * 30)
             
             # Show input
-            preview = scenario['text'][:100] + "..." if len(scenario['text']) > 100 else scenario['text']
-            print(f"📝 Input Text: {preview}")
+            print(f"📝 Input Text: {preview(scenario['text'], 100)}")
             print(f"📚 History: {' -> '.join(scenario['history'][-2:])}")
             
-            # Analyze with prompt system
-            session_stats = {
-                'session_duration': 10.0 + i * 2,
-                'total_queries': i,
-                'frames_per_minute': 2.5
-            }
-            
             try:
-                result = system.analyze_content(scenario['text'], scenario['history'], session_stats)
+                result = future.result()
             except Exception as e:
                 print(f"Error analyzing content: {e}")
                 # Create a fallback result
@@ -89,7 +97,7 @@ def demo_prompt_system():
             print(f"🧠 Analysis Type: {result.analysis_type}")
             
             if result.analysis_type == "ai_generated":
-                print(f"💡 AI Insight: {result.main_insight[:150]}...")
+                print(f"💡 AI Insight: {preview(result.main_insight, 150)}")
             elif result.analysis_type == "premade":
                 print(f"⚡ Quick Response: {result.main_insight}")
             else:
@@ -104,9 +112,6 @@ def demo_prompt_system():
                 print(f"❓ Guided Questions ({len(result.questions)}):")
                 for j, question in enumerate(result.questions[:2], 1):
                     print(f"   {j}. {question}")
-            
-            # Small delay for demo effect
-            time.sleep(1)
         
         # Show session summary
         print(f"\n📈 Demo Session Summary:")
@@ -201,4 +206,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Make sibling modules importable when run from another directory
+    sys.path.insert(0, _HERE)
     sys.exit(main())
\ No newline at end of file
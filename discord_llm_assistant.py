@@ -5,17 +5,49 @@ Connects OCR bridge to LLMs for real-time Discord screenshare analysis
 """
 
 import asyncio
+import hashlib
 import json
+import logging
 import time
 import requests
-from typing import Dict, List, Optional
-from datetime import datetime
-import subprocess
+from collections import deque
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import signal
-import sys
+import threading
 
 from llm_ocr_bridge import LLMOCRBridge, ScreenContext, OCRFrame
 
+# orjson parses the streamed NDJSON chunks much faster when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    json_loads = orjson.loads
+    
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+else:
+    json_loads = json.loads
+    
+    def json_dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+logger = logging.getLogger(__name__)
+
+# Screen analysis prompt, filled in per context update
+ANALYSIS_PROMPT_TEMPLATE = """Current screen shows: "{text}"
+
+Recent activity: {recent}
+
+Session stats: {stats}
+
+What is the user currently doing? Provide a brief analysis and any helpful suggestions."""
+
 
 class DiscordLLMAssistant:
     """LLM assistant that analyzes Discord screenshare content in real-time"""
@@ -23,10 +55,40 @@ class DiscordLLMAssistant:
     def __init__(self, llm_config: Dict = None):
         self.llm_config = llm_config or self.get_default_llm_config()
         self.bridge = LLMOCRBridge()
-        self.conversation_history = []
-        self.analysis_count = 0
+        self.conversation_history: deque = deque(maxlen=20)
         self.session_start = time.time()
         
+        # Last formatted frame timestamp, reused for frames within the same second
+        self._last_ts_sec = -1
+        self._last_ts_str = ""
+        
+        # Recent analyses keyed on a digest of the stable prompt inputs
+        self._response_cache: Dict[str, Tuple[float, str]] = {}
+        self.response_cache_size = 128
+        self.response_cache_ttl = 300.0
+        
+        # Event loop driving analyses; set while start() is running
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        
+        # Single-slot queue holding the latest context awaiting analysis
+        self._ctx_queue: Optional[asyncio.Queue] = None
+        
+        # Minimum seconds between analyses, and what was last analyzed
+        self.min_analysis_interval = 2.0
+        self._last_analyze = 0.0
+        self._last_text_hash: Optional[int] = None
+        
+        # Pooled keep-alive HTTP session shared by all LLM API calls
+        self.http = requests.Session()
+        self.http.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=20,
+                                               max_retries=Retry(total=2, backoff_factor=0.2)))
+        
+        # OpenAI client built once so its HTTPS connections are reused across queries
+        self._openai = None
+        if self.llm_config["provider"] == "openai":
+            self._openai = self.create_openai_client()
+        
         # Setup callbacks
         self.bridge.add_context_callback(self.on_context_update)
         self.bridge.add_text_callback(self.on_text_detected)
@@ -51,72 +113,158 @@ Keep responses concise and actionable. Focus on what's currently visible and cha
     
     def on_text_detected(self, frame: OCRFrame):
         """Handle individual OCR frame detection"""
-        print(f"👁️  OCR Frame {frame.frame_id}: {frame.text[:80]}...")
+        # %.Ns truncates during formatting, so suppressed records never build a preview
+        logger.debug("👁️  OCR Frame %s: %.80s...", frame.frame_id, frame.text)
         
         # Log significant text changes
-        if len(frame.text) > 20:  # Only log substantial text
-            timestamp = datetime.fromtimestamp(frame.timestamp).strftime("%H:%M:%S")
-            print(f"📄 [{timestamp}] Detected: {frame.text[:100]}...")
+        if len(frame.text) > 20 and logger.isEnabledFor(logging.INFO):  # Only log substantial text
+            logger.info("📄 [%s] Detected: %.100s...", self.format_timestamp(frame.timestamp), frame.text)
+    
+    def format_timestamp(self, timestamp: float) -> str:
+        """HH:MM:SS for a frame timestamp, formatted once per wall-clock second"""
+        sec = int(timestamp)
+        if sec != self._last_ts_sec:
+            self._last_ts_sec = sec
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        return self._last_ts_str
     
     def on_context_update(self, context: ScreenContext):
         """Handle context updates from OCR bridge"""
         if not context.current_text or len(context.current_text) < 10:
             return
             
-        # Only analyze every few updates to avoid spam
-        self.analysis_count += 1
-        if self.analysis_count % 3 != 0:
-            return
+        # Called from the bridge thread; hand the context to the event loop,
+        # which owns the queue
+        loop = self._loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._enqueue_context, context)
+            except RuntimeError:
+                pass  # Event loop already closed
+    
+    def _enqueue_context(self, context: ScreenContext):
+        """Replace any context still waiting for analysis with the newest one"""
+        try:
+            self._ctx_queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+        self._ctx_queue.put_nowait(context)
+    
+    async def _analyzer_loop(self):
+        """Analyze the latest queued context, one analysis at a time"""
+        while True:
+            context = await self._ctx_queue.get()
+            
+            # Space analyses out in time; newer contexts arriving meanwhile win
+            wait = self._last_analyze + self.min_analysis_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                if not self._ctx_queue.empty():
+                    context = self._ctx_queue.get_nowait()
             
-        print(f"\n🧠 Analyzing screen context (update #{self.analysis_count})...")
-        self.analyze_screen_content(context)
+            # Screen text unchanged since the last analysis
+            text_hash = hash(context.current_text)
+            if text_hash == self._last_text_hash:
+                continue
+            self._last_text_hash = text_hash
+            self._last_analyze = time.monotonic()
+            
+            print("\n🧠 Analyzing screen context...")
+            await self.analyze_screen_content(context)
     
-    def analyze_screen_content(self, context: ScreenContext):
+    async def analyze_screen_content(self, context: ScreenContext):
         """Send screen context to LLM for analysis"""
         try:
+            # Identical screen content was analyzed recently; reuse that answer
+            cache_key = self.analysis_cache_key(context)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                print("\n🤖 AI Analysis (cached):")
+                print(f"📝 {cached}")
+                print("-" * 60)
+                return
+            
             # Build analysis prompt
             prompt = self.build_analysis_prompt(context)
             
-            # Get LLM response
-            response = self.query_llm(prompt)
+            # Print streamed tokens as soon as they arrive
+            streamed = False
+            
+            def on_token(token: str):
+                nonlocal streamed
+                if not streamed:
+                    print("\n🤖 AI Analysis:")
+                    print("📝 ", end="")
+                    streamed = True
+                print(token, end="", flush=True)
+            
+            # Get LLM response without blocking the event loop
+            response = await asyncio.to_thread(self.query_llm, prompt, on_token)
             
             if response:
-                print(f"\n🤖 AI Analysis:")
-                print(f"📝 {response}")
+                if streamed:
+                    print()
+                else:
+                    print("\n🤖 AI Analysis:")
+                    print(f"📝 {response}")
                 print("-" * 60)
                 
-                # Store in conversation history
+                self._cache_put(cache_key, response)
+                
+                # Store in conversation history (bounded; oldest entries drop off)
                 self.conversation_history.append({
                     "timestamp": time.time(),
                     "context": context.current_text[:200],
                     "analysis": response
                 })
-                
-                # Keep history manageable
-                if len(self.conversation_history) > 20:
-                    self.conversation_history = self.conversation_history[-15:]
                     
         except Exception as e:
             print(f"❌ Analysis error: {e}")
     
+    def analysis_cache_key(self, context: ScreenContext) -> str:
+        """Digest of the prompt inputs that identify the screen content
+        
+        Session stats are left out so their drift between updates doesn't
+        defeat the cache.
+        """
+        stable = f"{context.current_text}\0{context.recent_activity}"
+        return hashlib.blake2b(stable.encode(), digest_size=16).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Return a cached response if present and not expired"""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+            
+        stored_at, response = entry
+        if time.time() - stored_at > self.response_cache_ttl:
+            del self._response_cache[key]
+            return None
+        return response
+    
+    def _cache_put(self, key: str, response: str):
+        """Cache a response, evicting the oldest entry when full"""
+        self._response_cache.pop(key, None)
+        if len(self._response_cache) >= self.response_cache_size:
+            del self._response_cache[next(iter(self._response_cache))]
+        self._response_cache[key] = (time.time(), response)
+    
     def build_analysis_prompt(self, context: ScreenContext) -> str:
         """Build prompt for LLM analysis"""
-        recent_activity = " -> ".join(context.recent_changes[-3:]) if context.recent_changes else "No recent changes"
-        
-        prompt = f"""Current screen shows: "{context.current_text}"
-
-Recent activity: {recent_activity}
-
-Session stats: {context.session_stats}
-
-What is the user currently doing? Provide a brief analysis and any helpful suggestions."""
-        
-        return prompt
+        return ANALYSIS_PROMPT_TEMPLATE.format_map({
+            "text": context.current_text,
+            "recent": context.recent_activity or "No recent changes",
+            "stats": context.session_stats
+        })
     
-    def query_llm(self, prompt: str) -> Optional[str]:
-        """Query the configured LLM service"""
+    def query_llm(self, prompt: str, on_token: Optional[Callable[[str], None]] = None) -> Optional[str]:
+        """Query the configured LLM service
+        
+        on_token, if given, receives response text incrementally from
+        providers that support streaming.
+        """
         if self.llm_config["provider"] == "ollama":
-            return self.query_ollama(prompt)
+            return self.query_ollama(prompt, on_token)
         elif self.llm_config["provider"] == "openai":
             return self.query_openai(prompt)
         elif self.llm_config["provider"] == "local":
@@ -125,42 +273,68 @@ What is the user currently doing? Provide a brief analysis and any helpful sugge
             print(f"❌ Unsupported LLM provider: {self.llm_config['provider']}")
             return None
     
-    def query_ollama(self, prompt: str) -> Optional[str]:
+    def stream_ollama(self, prompt: str) -> Iterator[str]:
+        """Yield Ollama response tokens as they are generated"""
+        payload = {
+            "model": self.llm_config["model"],
+            "prompt": prompt,
+            "stream": True,
+            "options": {
+                "temperature": self.llm_config["temperature"],
+                "num_predict": self.llm_config["max_tokens"]
+            }
+        }
+        
+        with self.http.post(self.llm_config["api_url"], json=payload,
+                            stream=True, timeout=(5, 60)) as response:
+            if response.status_code != 200:
+                raise RuntimeError(f"Ollama API error: {response.status_code}")
+                
+            # NDJSON: one chunk object per line
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json_loads(line)
+                if chunk.get("response"):
+                    yield chunk["response"]
+                if chunk.get("done"):
+                    break
+    
+    def query_ollama(self, prompt: str, on_token: Optional[Callable[[str], None]] = None) -> Optional[str]:
         """Query Ollama local LLM"""
         try:
-            payload = {
-                "model": self.llm_config["model"],
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": self.llm_config["temperature"],
-                    "num_predict": self.llm_config["max_tokens"]
-                }
-            }
-            
-            response = requests.post(
-                self.llm_config["api_url"],
-                json=payload,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                return result.get("response", "").strip()
-            else:
-                print(f"❌ Ollama API error: {response.status_code}")
-                return None
+            tokens = []
+            for token in self.stream_ollama(prompt):
+                tokens.append(token)
+                if on_token:
+                    on_token(token)
+                    
+            return "".join(tokens).strip()
                 
         except Exception as e:
             print(f"❌ Ollama query error: {e}")
             return None
     
-    def query_openai(self, prompt: str) -> Optional[str]:
-        """Query OpenAI API"""
+    def create_openai_client(self):
+        """Create an OpenAI client with a keep-alive connection pool"""
         try:
+            import httpx
             import openai
             
-            response = openai.ChatCompletion.create(
+            return openai.OpenAI(http_client=httpx.Client(
+                limits=httpx.Limits(max_keepalive_connections=10)))
+        except Exception as e:
+            print(f"❌ OpenAI client setup error: {e}")
+            return None
+    
+    def query_openai(self, prompt: str) -> Optional[str]:
+        """Query OpenAI API"""
+        if self._openai is None:
+            print("❌ OpenAI client not available")
+            return None
+            
+        try:
+            response = self._openai.chat.completions.create(
                 model=self.llm_config["model"],
                 messages=[
                     {"role": "system", "content": self.llm_config["system_prompt"]},
@@ -177,36 +351,56 @@ What is the user currently doing? Provide a brief analysis and any helpful sugge
             return None
     
     def query_local_llm(self, prompt: str) -> Optional[str]:
-        """Query local LLM via subprocess"""
+        """Query local LLM in-process"""
         try:
-            # Example for local model via command line
-            # Adjust command based on your local LLM setup
-            cmd = ["python3", "-c", f"""
-import sys
-# Placeholder for local LLM integration
-print("Local LLM analysis: User appears to be working with text content.")
-print("Suggestion: Consider using OCR confidence scores for better accuracy.")
-"""]
+            # Imported on first use; the model stays loaded for later queries
+            import local_llm
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                return result.stdout.strip()
-            else:
-                print(f"❌ Local LLM error: {result.stderr}")
-                return None
+            return local_llm.analyze(prompt).strip()
                 
         except Exception as e:
             print(f"❌ Local LLM query error: {e}")
             return None
     
-    def interactive_mode(self):
+    async def read_input(self, prompt: str) -> str:
+        """Await a line from stdin without tying up the default executor
+        
+        input() can't be interrupted, so it runs on a daemon thread that
+        won't hold up interpreter shutdown.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        def resolve(result=None, error=None):
+            if future.done():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        
+        def reader():
+            # Pass values as arguments: the except variable is unbound once its block ends
+            try:
+                args = (input(prompt), None)
+            except Exception as e:
+                args = (None, e)
+            try:
+                loop.call_soon_threadsafe(resolve, *args)
+            except RuntimeError:
+                pass  # Event loop already closed
+        
+        threading.Thread(target=reader, daemon=True).start()
+        return await future
+    
+    async def interactive_mode(self):
         """Interactive mode for asking questions about screen content"""
         print("\n💬 Interactive Mode Started")
         print("💡 Ask questions about what's on screen, or type 'exit' to quit")
         
         while True:
             try:
-                user_input = input("\n❓ Your question: ").strip()
+                user_input = (await self.read_input("\n❓ Your question: ")).strip()
                 
                 if user_input.lower() in ['exit', 'quit', 'stop']:
                     break
@@ -225,51 +419,75 @@ User question: {user_input}
 Please answer based on what's currently visible on the screen."""
                 
                 # Get LLM response
-                response = self.query_llm(prompt)
+                response = await asyncio.to_thread(self.query_llm, prompt)
                 
                 if response:
                     print(f"\n🤖 AI Response: {response}")
                 else:
                     print("❌ Sorry, I couldn't process that question.")
                     
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 break
             except Exception as e:
                 print(f"❌ Interactive mode error: {e}")
         
         print("💬 Interactive mode ended")
     
-    def start(self):
-        """Start the Discord LLM assistant"""
+    def start(self, interactive: bool = False):
+        """Start the Discord LLM assistant (blocks until stopped)"""
         print("🚀 Starting Discord LLM Assistant...")
         
+        try:
+            asyncio.run(self._run(interactive))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.bridge.stop()
+            self.http.close()
+            if self._openai is not None:
+                self._openai.close()
+            print("👋 Discord LLM Assistant stopped")
+    
+    async def _run(self, interactive: bool):
+        """Event loop body: run the bridge and optional Q&A until asked to stop"""
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self._ctx_queue = asyncio.Queue(maxsize=1)
+        analyzer_task = asyncio.create_task(self._analyzer_loop())
+        
         # Start OCR bridge
         self.bridge.start()
         
         # Setup signal handlers
-        def signal_handler(sig, frame):
+        def signal_handler():
             print("\n🛑 Shutting down Discord LLM Assistant...")
-            self.bridge.stop()
-            sys.exit(0)
+            self._stop_event.set()
         
-        signal.signal(signal.SIGINT, signal_handler)
+        try:
+            self._loop.add_signal_handler(signal.SIGINT, signal_handler)
+        except NotImplementedError:
+            pass  # Windows: Ctrl+C surfaces as KeyboardInterrupt instead
         
         print("✅ Discord LLM Assistant is running!")
         print("📺 Start your Discord screenshare now")
         print("🤖 AI will analyze screen content in real-time")
-        print("💡 Press Ctrl+I for interactive mode, Ctrl+C to quit")
+        print("💡 Press Ctrl+C to quit")
         
-        # Main loop
-        try:
-            while True:
-                time.sleep(1)
-                
-                # Check for interactive mode trigger (simplified)
-                # In a real implementation, you might use keyboard listeners
+        if interactive:
+            async def run_interactive():
+                await asyncio.sleep(2)  # Let OCR bridge initialize
+                await self.interactive_mode()
+                self._stop_event.set()
                 
-        except KeyboardInterrupt:
-            self.bridge.stop()
-            print("👋 Discord LLM Assistant stopped")
+            interactive_task = asyncio.create_task(run_interactive())
+        
+        try:
+            await self._stop_event.wait()
+        finally:
+            self._loop = None
+            analyzer_task.cancel()
+            if interactive:
+                interactive_task.cancel()
 
 
 def create_assistant_config():
@@ -292,7 +510,7 @@ def create_assistant_config():
     }
     
     with open("discord_llm_config.json", "w") as f:
-        json.dump(config, f, indent=2)
+        f.write(json_dumps(config))
     
     print("📄 Created discord_llm_config.json")
     print("💡 Edit this file to customize LLM provider and OCR regions")
@@ -311,6 +529,9 @@ def main():
     
     args = parser.parse_args()
     
+    # Per-frame OCR output goes through logging; DEBUG adds every frame
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     if args.create_config:
         create_assistant_config()
         return
@@ -329,13 +550,8 @@ Provide helpful, concise insights about what the user is doing and suggest impro
     # Create assistant
     assistant = DiscordLLMAssistant(llm_config)
     
-    # Start assistant
-    assistant.start()
-    
-    # Enter interactive mode if requested
-    if args.interactive:
-        time.sleep(2)  # Let OCR bridge initialize
-        assistant.interactive_mode()
+    # Start assistant, entering interactive mode if requested
+    assistant.start(interactive=args.interactive)
 
 
 if __name__ == "__main__":
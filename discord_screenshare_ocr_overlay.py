@@ -4,13 +4,23 @@ Discord Screenshare OCR Overlay
 Real-time transparent overlay showing OCR text for Discord screenshare viewers
 """
 
+import os
+
+# Tesseract's OpenMP threading only adds overhead for one image at a time;
+# set before anything can launch tesseract so every OCR call inherits it
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
 import sys
 import time
 import json
+import re
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Callable
 import threading
 import traceback
+import zlib
+from queue import Queue, Empty, Full
 
 from PyQt5.QtWidgets import (QApplication, QWidget, QLabel, QVBoxLayout, 
                              QSystemTrayIcon, QMenu, QAction, qApp,
@@ -23,41 +33,165 @@ import mss
 from PIL import Image
 from tesseract_timeout_fix_working import WorkingFastScreenOCR
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import cv2
+    CV2_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    CV2_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def bgra_to_gray_thresh(buf, out, thresh):
+        """Binarize raw BGRA bytes into one 8-bit gray value per pixel"""
+        for i in prange(out.size):
+            j = i * 4
+            y = (np.int32(buf[j]) * 29 + np.int32(buf[j + 1]) * 150 + np.int32(buf[j + 2]) * 77) >> 8
+            out[i] = 255 if y > thresh else 0
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    json_loads = orjson.loads
+    
+    def json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    json_loads = json.loads
+    
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+def deep_merge(default: Dict[str, Any], loaded: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill keys missing from loaded with defaults, recursing into nested dicts"""
+    merged = dict(loaded)
+    for key, value in default.items():
+        if key not in merged:
+            merged[key] = value
+        elif isinstance(value, dict) and isinstance(merged[key], dict):
+            merged[key] = deep_merge(value, merged[key])
+    return merged
+
+
+# Runs of whitespace, collapsed before comparing OCR results
+WHITESPACE_RE = re.compile(r'\s+')
+
 
 class OCRWorker(QThread):
     """Background thread for OCR processing to keep UI responsive"""
     text_ready = pyqtSignal(str)
+    ready = pyqtSignal()
+    failed = pyqtSignal(str)
     
-    def __init__(self, ocr_engine):
+    def __init__(self, engine_factory: Callable[[], Any], frame_size: Tuple[int, int]):
         super().__init__()
-        self.ocr_engine = ocr_engine
+        self.engine_factory = engine_factory
+        self.frame_size = frame_size
+        self.ocr_engine = None
         self.running = False
-        self.last_text = ""
-        self.image_queue = []
+        self._last_hash = None  # Hash of the last emitted text, whitespace-normalized
+        self.batch_size = 1
+        # Created once the engine is loaded; frames arriving before then are dropped
+        self.image_queue = None
         
     def add_image(self, image):
         """Add image to processing queue"""
-        # Keep only the latest image to avoid lag
-        self.image_queue = [image]
+        image_queue = self.image_queue
+        if image_queue is None:
+            return  # OCR engine still loading
+            
+        # Drop the oldest pending frame when full to avoid lag
+        try:
+            image_queue.put_nowait(image)
+        except Full:
+            try:
+                image_queue.get_nowait()
+            except Empty:
+                pass
+            try:
+                image_queue.put_nowait(image)
+            except Full:
+                pass  # Another frame landed first; it is just as fresh
+                
+    def next_batch(self) -> Optional[list]:
+        """Block for a frame, then take any others already waiting (None when stopping)"""
+        images = [self.image_queue.get()]
+        while len(images) < self.batch_size:
+            try:
+                images.append(self.image_queue.get_nowait())
+            except Empty:
+                break
+        if any(image is None for image in images):
+            return None
+        return images
+        
+    def extract_text(self, images: list) -> Optional[str]:
+        """OCR a batch of frames in one engine call when the engine supports it"""
+        if len(images) == 1:
+            return self.ocr_engine.extract_screen_text(images[0])
+            
+        # Keep each distinct line once, in the order it was first seen
+        texts = self.ocr_engine.extract_screen_text_batch(images)
+        lines = dict.fromkeys(line for text in texts if text for line in text.splitlines())
+        return "\n".join(lines) or None
         
     def run(self):
         """Main OCR processing loop"""
         self.running = True
         
+        # Load the engine here so a slow init (trained data, ONNX sessions)
+        # never blocks the GUI thread
+        try:
+            self.ocr_engine = self.engine_factory()
+        except Exception as e:
+            print(f"OCR engine error: {e}")
+            self.failed.emit(str(e))
+            return
+            
+        try:
+            self.ocr_engine.configure(*self.frame_size)
+        except Exception as e:
+            print(f"OCR engine configure error: {e}")  # Still usable, just unspecialized
+            
+        # Engines that can batch keep the last few frames; others keep only the latest
+        self.batch_size = getattr(self.ocr_engine, 'batch_size', 1)
+        self.image_queue = Queue(maxsize=self.batch_size)
+        self.ready.emit()
+        
         while self.running:
             try:
-                if self.image_queue:
-                    image = self.image_queue.pop(0)
-                    
-                    # Extract text using our working OCR
-                    text = self.ocr_engine.extract_screen_text(image)
+                # Sleep until a frame arrives; stop() wakes us with None
+                images = self.next_batch()
+                if images is None:
+                    break
                     
-                    # Only emit if text changed and is non-empty
-                    if text and text.strip() and text != self.last_text:
-                        self.last_text = text
-                        self.text_ready.emit(text.strip())
+                # Extract text using our working OCR
+                text = self.extract_text(images)
                 
-                time.sleep(0.05)  # Small delay to prevent high CPU usage
+                # Only emit if text changed and is non-empty; whitespace jitter
+                # between OCR passes doesn't count as a change
+                if text:
+                    normalized = WHITESPACE_RE.sub(' ', text).strip()
+                    text_hash = hash(normalized)
+                    if normalized and text_hash != self._last_hash:
+                        self._last_hash = text_hash
+                        self.text_ready.emit(text.strip())
                     
             except Exception as e:
                 print(f"OCR Worker error: {e}")
@@ -66,6 +200,94 @@ class OCRWorker(QThread):
     def stop(self):
         """Stop the OCR processing"""
         self.running = False
+        self.add_image(None)  # Wake run() immediately
+        self.wait()
+
+
+class CaptureWorker(QThread):
+    """Background thread grabbing the capture region at a fixed frame rate"""
+    frame_ready = pyqtSignal(object)
+    
+    def __init__(self, monitor: Dict[str, int], fps: int, downscale: int = 1, threshold: int = 0):
+        super().__init__()
+        self.monitor = monitor
+        self.interval = 1.0 / fps
+        self.downscale = max(1, int(downscale))
+        self.threshold = int(threshold)
+        self.running = False
+        # crc32 of the last frame sent on; a frame with the same pixels is skipped
+        self.last_signature = None
+        
+    def resend(self):
+        """Send the next frame even if unchanged (the receiver may have dropped the last one)"""
+        self.last_signature = None
+        
+    def to_ocr_image(self, screenshot):
+        """Convert a BGRA grab to the grayscale (optionally downscaled/binarized) image OCR runs on
+        
+        With numpy this is a contiguous uint8 (H, W) array owned by the receiver;
+        otherwise a PIL 'L' image.
+        """
+        if NUMBA_AVAILABLE and self.threshold and self.downscale == 1:
+            # Gray conversion and thresholding fused into one parallel pass
+            buf = np.asarray(screenshot).reshape(-1)
+            out = np.empty(screenshot.height * screenshot.width, dtype=np.uint8)
+            bgra_to_gray_thresh(buf, out, self.threshold)
+            return out.reshape(screenshot.height, screenshot.width)
+            
+        if CV2_AVAILABLE:
+            # mss exposes its BGRA buffer through the array interface: (H, W, 4) uint8, no copy
+            arr = np.asarray(screenshot)
+            gray = cv2.cvtColor(arr, cv2.COLOR_BGRA2GRAY)
+            if self.downscale > 1:
+                gray = cv2.resize(gray, None, fx=1 / self.downscale, fy=1 / self.downscale,
+                                  interpolation=cv2.INTER_AREA)
+            if self.threshold:
+                _, gray = cv2.threshold(gray, self.threshold, 255, cv2.THRESH_BINARY)
+            return gray
+            
+        # Decode straight from mss's raw buffer; .bgra would copy it to bytes first
+        img = Image.frombuffer('RGB', screenshot.size, screenshot.raw, 'raw', 'BGRX', 0, 1).convert('L')
+        if self.downscale > 1:
+            img = img.reduce(self.downscale)
+        if self.threshold:
+            threshold = self.threshold
+            img = img.point(lambda v: 255 if v > threshold else 0)
+        return img
+        
+    def run(self):
+        """Main capture loop"""
+        self.running = True
+        
+        if sys.platform == 'win32':
+            # Skip layered windows in BitBlt; much faster grabs on Windows
+            from mss import windows as mss_windows
+            mss_windows.CAPTUREBLT = 0
+            
+        # mss handles are bound to the thread that creates them
+        self.last_signature = None
+        with mss.mss() as sct:
+            while self.running:
+                started = time.monotonic()
+                try:
+                    screenshot = sct.grab(self.monitor)
+                    
+                    # Unchanged pixels can't yield new text; skip conversion and OCR
+                    signature = zlib.crc32(screenshot.raw)
+                    if signature != self.last_signature:
+                        self.last_signature = signature
+                        self.frame_ready.emit(self.to_ocr_image(screenshot))
+                    
+                except Exception as e:
+                    print(f"Screen capture error: {e}")
+                    
+                remaining = self.interval - (time.monotonic() - started)
+                if remaining > 0:
+                    self.msleep(int(remaining * 1000))
+                    
+    def stop(self):
+        """Stop the screen capture"""
+        self.running = False
         self.wait()
 
 
@@ -145,20 +367,27 @@ class OCROverlayWindow(QWidget):
     def __init__(self):
         super().__init__()
         self.config_file = Path.home() / ".ocr_overlay_config.json"
+        self._saved_config = None  # Last JSON written to / read from config_file
         self.config = self.load_config()
         
-        # Initialize OCR and screen capture
-        self.ocr_engine = WorkingFastScreenOCR(timeout=3.0)
-        self.sct = mss.mss()
+        # Initialize OCR
+        self.ocr_engine = None  # Loaded on the OCR worker thread by get_ocr_engine()
+        self._monitor = None
         
-        # OCR worker thread
+        # OCR and screen capture worker threads
         self.ocr_worker = None
-        
-        # Timer for screen capture
-        self.capture_timer = QTimer()
-        self.capture_timer.timeout.connect(self.capture_screen)
+        self.capture_worker = None
         self.fps = 8
         
+        # Coalesce OCR text updates so the label re-lays out at most 10 times a second
+        self._pending_text = ""
+        self._loading_text = "Loading OCR engine..."
+        self._truncation_suffix = "..."
+        self.text_timer = QTimer(self)
+        self.text_timer.setSingleShot(True)
+        self.text_timer.setInterval(100)
+        self.text_timer.timeout.connect(self.flush_text)
+        
         # Setup UI
         self.init_ui()
         self.setup_tray()
@@ -192,28 +421,54 @@ class OCROverlayWindow(QWidget):
                 "text": "#00FF00",
                 "background": "#000000"
             },
-            "opacity": 0.8
+            "opacity": 0.8,
+            "ocr_backend": "tesseract",  # "tesseract" or "onnx"
+            "downscale": 1,  # Shrink captures by this factor before OCR (2 halves each side)
+            "threshold": 0  # Binarize gray levels above this before OCR (0 = off)
         }
         
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
-                # Merge with defaults to handle missing keys
-                for key, value in default_config.items():
-                    if key not in loaded_config:
-                        loaded_config[key] = value
-                return loaded_config
+                loaded_config = json_loads(self.config_file.read_bytes())
+                self._saved_config = json_dumps(loaded_config)
+                # Merge with defaults to handle missing keys, including nested ones
+                return deep_merge(default_config, loaded_config)
         except Exception as e:
             print(f"Error loading config: {e}")
             
         return default_config
     
+    def get_ocr_engine(self):
+        """Return the OCR engine, creating it on first use (runs on the OCR worker thread)"""
+        if self.ocr_engine is None:
+            self.ocr_engine = self.create_ocr_engine()
+        return self.ocr_engine
+    
+    def create_ocr_engine(self):
+        """Create the OCR engine selected by the ocr_backend setting"""
+        if self.config.get('ocr_backend') == 'onnx':
+            try:
+                from onnx_ocr_engine import OnnxOCREngine
+                engine = OnnxOCREngine()
+                print("✅ Using ONNX Runtime OCR backend")
+                return engine
+            except Exception as e:
+                print(f"⚠️ ONNX OCR backend unavailable ({e}), falling back to Tesseract")
+                
+        return WorkingFastScreenOCR(timeout=3.0)
+    
     def save_config(self):
-        """Save configuration to file"""
+        """Save configuration to file (atomically, and only when it changed)"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            data = json_dumps(self.config)
+            if data == self._saved_config:
+                return
+                
+            # Write alongside and rename so a crash never leaves a truncated file
+            tmp_file = self.config_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.config_file)
+            self._saved_config = data
         except Exception as e:
             print(f"Error saving config: {e}")
     
@@ -230,6 +485,8 @@ class OCROverlayWindow(QWidget):
             self.setAttribute(Qt.WA_TransparentForMouseEvents)
             
         self.setAttribute(Qt.WA_TranslucentBackground)
+        # Nothing to clear behind the label; skip the system background fill on repaint
+        self.setAttribute(Qt.WA_NoSystemBackground)
         self.setWindowOpacity(self.config['opacity'])
         
         # Layout
@@ -237,7 +494,7 @@ class OCROverlayWindow(QWidget):
         layout.setContentsMargins(10, 10, 10, 10)
         
         # Text display label
-        self.text_label = QLabel("Waiting for text...")
+        self.text_label = QLabel(self._loading_text)
         self.text_label.setWordWrap(True)
         self.text_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
         
@@ -350,71 +607,85 @@ class OCROverlayWindow(QWidget):
         time.sleep(0.1)
         self.start_ocr()
         
-    def capture_screen(self):
-        """Capture screen and send to OCR worker"""
-        try:
-            # Create monitor configuration for mss
-            monitor_config = {
-                "top": self.config['capture_region']['y'],
-                "left": self.config['capture_region']['x'],
-                "width": self.config['capture_region']['width'],
-                "height": self.config['capture_region']['height']
-            }
-            
-            # Capture screen region
-            screenshot = self.sct.grab(monitor_config)
-            img = Image.frombytes('RGB', screenshot.size, screenshot.bgra, 'raw', 'BGRX')
-            
-            # Send to OCR worker if it's running
-            if self.ocr_worker and self.ocr_worker.isRunning():
-                self.ocr_worker.add_image(img)
-                
-        except Exception as e:
-            print(f"Screen capture error: {e}")
-    
     def start_ocr(self):
         """Start OCR processing"""
         if self.ocr_worker and self.ocr_worker.isRunning():
             return
             
-        # Start OCR worker thread
-        self.ocr_worker = OCRWorker(self.ocr_engine)
+        # Start OCR worker thread; the engine is specialized for the frame size it will see
+        downscale = max(1, int(self.config.get('downscale', 1)))
+        frame_size = (self.config['capture_region']['width'] // downscale,
+                      self.config['capture_region']['height'] // downscale)
+        self.ocr_worker = OCRWorker(self.get_ocr_engine, frame_size)
         self.ocr_worker.text_ready.connect(self.update_text)
+        self.ocr_worker.ready.connect(self.on_ocr_ready)
+        self.ocr_worker.failed.connect(self.on_ocr_failed)
         self.ocr_worker.start()
         
-        # Start screen capture timer
-        self.fps = self.config['fps']
-        interval = int(1000 / self.fps)  # Convert to milliseconds
-        self.capture_timer.start(interval)
-        
-        capture_config = {
+        # Monitor configuration for mss, built once per capture session
+        self._monitor = {
             "top": self.config['capture_region']['y'],
             "left": self.config['capture_region']['x'],
             "width": self.config['capture_region']['width'],
             "height": self.config['capture_region']['height']
         }
         
-        print(f"✅ OCR Overlay started - capturing region {capture_config} at {self.fps} FPS")
+        # Start screen capture thread; add_image only touches a thread-safe
+        # queue, so frames go to the OCR worker without a GUI-thread hop
+        self.fps = self.config['fps']
+        self.capture_worker = CaptureWorker(self._monitor, self.fps, self.config.get('downscale', 1),
+                                            self.config.get('threshold', 0))
+        self.capture_worker.frame_ready.connect(self.ocr_worker.add_image, Qt.DirectConnection)
+        # Frames captured while the engine loaded were dropped; resend the current
+        # one even on a static screen
+        self.ocr_worker.ready.connect(self.capture_worker.resend, Qt.DirectConnection)
+        self.capture_worker.start()
+        
+        print(f"✅ OCR Overlay started - capturing region {self._monitor} at {self.fps} FPS")
         
     def stop_ocr(self):
         """Stop OCR processing"""
-        # Stop screen capture timer
-        if self.capture_timer.isActive():
-            self.capture_timer.stop()
+        # Stop screen capture thread
+        if self.capture_worker and self.capture_worker.isRunning():
+            self.capture_worker.stop()
+            self.capture_worker = None
             
         # Stop OCR worker thread
         if self.ocr_worker and self.ocr_worker.isRunning():
             self.ocr_worker.stop()
             self.ocr_worker = None
             
+    @pyqtSlot()
+    def on_ocr_ready(self):
+        """Replace the loading message once the OCR engine is up"""
+        if self.text_label.text() == self._loading_text:
+            self.text_label.setText("Waiting for text...")
+            
+    @pyqtSlot(str)
+    def on_ocr_failed(self, error: str):
+        """Replace the loading message with the engine load error"""
+        self.text_label.setText(f"❌ OCR engine failed to load: {error}")
+            
     @pyqtSlot(str)
     def update_text(self, text: str):
-        """Update the displayed text"""
+        """Queue text for display; the label is refreshed at most every 100ms"""
+        self._pending_text = text
+        if not self.text_timer.isActive():
+            self.text_timer.start()
+            
+    def flush_text(self):
+        """Show the most recent OCR text"""
+        text = self._pending_text
+        
         # Limit text length to prevent UI issues
         if len(text) > 500:
-            text = text[:500] + "..."
+            text = text[:500] + self._truncation_suffix
             
+        # One repaint of just the label for the whole update
+        self.text_label.setUpdatesEnabled(False)
         self.text_label.setText(text)
+        self.text_label.setUpdatesEnabled(True)
+        self.text_label.update(self.text_label.rect())
         
     def keyPressEvent(self, event):
         """Handle keyboard shortcuts"""
@@ -454,7 +725,6 @@ def main():
     
     # Check dependencies
     try:
-        import mss
         from tesseract_timeout_fix_working import WorkingFastScreenOCR
     except ImportError as e:
         print(f"❌ Missing dependency: {e}")
@@ -7,29 +7,150 @@ Real-time LLM interaction window with OCR status and keystroke monitoring
 import sys
 import json
 import time
-import threading
-from datetime import datetime
-from typing import Dict, Optional, Callable
+from collections import deque
+from typing import Dict, NamedTuple, Optional, Callable, Tuple, Union
 
 try:
     from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                                 QHBoxLayout, QTextEdit, QLineEdit, QPushButton, 
                                 QLabel, QFrame, QSplitter, QCheckBox, QGroupBox,
                                 QProgressBar, QSystemTrayIcon, QMenu, QAction)
-    from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject, QThread
-    from PyQt5.QtGui import QFont, QPalette, QColor, QIcon, QPixmap
+    from PyQt5.QtCore import (Qt, QTimer, pyqtSignal, QObject, QThread, QThreadPool,
+                              QRunnable, QSignalBlocker)
+    from PyQt5.QtGui import QFont, QPalette, QColor, QIcon, QPixmap, QPainter, QTextCursor, QTextCharFormat
     PYQT5_AVAILABLE = True
 except ImportError:
     PYQT5_AVAILABLE = False
 
+# Dark theme stylesheet, parsed by Qt only when the dark theme is selected
+DARK_QSS = """
+QMainWindow {
+    background-color: #2b2b2b;
+    color: #ffffff;
+}
+QGroupBox {
+    font-weight: bold;
+    border: 1px solid #555555;
+    margin-top: 10px;
+    padding-top: 10px;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}
+QTextEdit {
+    background-color: #1e1e1e;
+    color: #ffffff;
+    border: 1px solid #555555;
+    selection-background-color: #0078d4;
+}
+QLineEdit {
+    background-color: #1e1e1e;
+    color: #ffffff;
+    border: 1px solid #555555;
+    padding: 5px;
+}
+QPushButton {
+    background-color: #0078d4;
+    color: #ffffff;
+    border: none;
+    padding: 5px 10px;
+    border-radius: 3px;
+}
+QPushButton:hover {
+    background-color: #106ebe;
+}
+QPushButton:pressed {
+    background-color: #005a9e;
+}
+QLabel {
+    color: #ffffff;
+}
+QCheckBox {
+    color: #ffffff;
+}
+"""
+
+# OCR activity bar value by seconds since the last update: (under, value)
+PROGRESS_BUCKETS = ((5, 100), (15, 70), (30, 40), (float('inf'), 10))
+
+# Emoji rendered once per (emoji, size); labels then paint a pixmap instead of
+# walking the font fallback chain on every repaint
+_EMOJI_PIXMAPS: Dict[Tuple[str, int], "QPixmap"] = {}
+
+def emoji_pixmap(emoji: str, size: int = 16) -> "QPixmap":
+    """Return a cached pixmap of an emoji glyph"""
+    key = (emoji, size)
+    pixmap = _EMOJI_PIXMAPS.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        font = painter.font()
+        font.setPixelSize(size - 2)
+        painter.setFont(font)
+        painter.drawText(pixmap.rect(), Qt.AlignCenter, emoji)
+        painter.end()
+        _EMOJI_PIXMAPS[key] = pixmap
+    return pixmap
+
+def emoji_label(emoji: str) -> "QLabel":
+    """QLabel showing a pre-rendered emoji"""
+    label = QLabel()
+    label.setPixmap(emoji_pixmap(emoji))
+    return label
+
+# Tray icon shared by every window, created on first use (needs a QApplication)
+_TRAY_ICON: Optional["QIcon"] = None
+
+def get_tray_icon() -> "QIcon":
+    """Return the shared system tray icon"""
+    global _TRAY_ICON
+    if _TRAY_ICON is None:
+        # Simple solid icon since no image file ships with the assistant
+        pixmap = QPixmap(16, 16)
+        pixmap.fill(QColor(0, 120, 212))  # Blue color
+        _TRAY_ICON = QIcon(pixmap)
+    return _TRAY_ICON
+
+
+class OcrStatus(NamedTuple):
+    """OCR status snapshot pushed to the GUI; last_update is a perf_counter() reading"""
+    fps: float
+    regions: int
+    last_update: float
+
 
 class LLMResponseSignal(QObject):
     """Signal emitter for thread-safe LLM responses"""
     new_response = pyqtSignal(str)
-    ocr_update = pyqtSignal(dict)
+    ocr_update = pyqtSignal(object)
+    ocr_pending = pyqtSignal()
     keystroke_update = pyqtSignal(dict)
 
 
+class LLMQueryTask(QRunnable):
+    """Runs one LLM query on the window's thread pool and emits the reply"""
+    
+    def __init__(self, callback: Callable, query: str, signals: LLMResponseSignal):
+        super().__init__()
+        self.callback = callback
+        self.query = query
+        self.signals = signals
+        
+    def run(self):
+        """Query LLM in a pool thread"""
+        try:
+            response = self.callback(self.query)
+            if response:
+                self.signals.new_response.emit(response)
+            else:
+                self.signals.new_response.emit("❌ No response from LLM")
+        except Exception as e:
+            self.signals.new_response.emit(f"❌ LLM Error: {str(e)}")
+
+
 class ScreenshareGUI(QMainWindow):
     """Main GUI window for screenshare assistant"""
     
@@ -42,25 +163,53 @@ class ScreenshareGUI(QMainWindow):
         self.config = config
         self.gui_config = config.get('gui', {})
         
+        # Window settings, resolved once with their defaults
+        g = self.gui_config
+        self.window_geometry = (g.get('window_x', 50), g.get('window_y', 50),
+                                g.get('window_width', 450), g.get('window_height', 600))
+        self.always_on_top = g.get('always_on_top', True)
+        self.theme = g.get('theme')
+        self.opacity = g.get('opacity', 0.95)
+        self.font_size = g.get('font_size', 10)
+        self.chat_max_lines = g.get('chat_max_lines', 2000)
+        
         # Signal handler for thread-safe updates
         self.signals = LLMResponseSignal()
         self.signals.new_response.connect(self.add_llm_response)
         self.signals.ocr_update.connect(self.update_ocr_status)
+        self.signals.ocr_pending.connect(self._schedule_ocr_flush)
         self.signals.keystroke_update.connect(self.update_keystroke_status)
         
         # State tracking
         self.llm_query_callback: Optional[Callable] = None
         self.keystroke_toggle_callback: Optional[Callable] = None
+        self.last_ocr_update = 0
+        self._last_ts_sec = -1
+        self._last_ts_str = ""
+        
+        # Latest status dicts awaiting the next coalesced label flush. The OCR
+        # box is filled from worker threads, so it is a one-slot deque
+        self._ocr_box = deque(maxlen=1)
+        self._ocr_scheduled = False
+        self._keystroke_pending = None
+        self._keystroke_scheduled = False
+        
+        # Last text written to each status label, keyed by id(label)
+        self._label_text: Dict[int, str] = {}
+        
+        # One reused worker thread: queries run in the order they were sent
+        self.query_pool = QThreadPool(self)
+        self.query_pool.setMaxThreadCount(1)
         
         # Setup UI
         self.setup_ui()
         self.setup_theme()
         self.setup_system_tray()
         
-        # Auto-update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.refresh_status)
-        self.update_timer.start(1000)  # Update every second
+        # Re-ages the "Last: Xs ago" label; armed by OCR updates instead of polling
+        self.age_timer = QTimer(self)
+        self.age_timer.setSingleShot(True)
+        self.age_timer.timeout.connect(self._refresh_age_labels)
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -71,15 +220,10 @@ class ScreenshareGUI(QMainWindow):
         
         # Window properties
         self.setWindowTitle("🤖 Screenshare LLM Assistant")
-        self.setGeometry(
-            self.gui_config.get('window_x', 50),
-            self.gui_config.get('window_y', 50),
-            self.gui_config.get('window_width', 450),
-            self.gui_config.get('window_height', 600)
-        )
+        self.setGeometry(*self.window_geometry)
         
         # Always on top if configured
-        if self.gui_config.get('always_on_top', True):
+        if self.always_on_top:
             self.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.Window)
         
         # Create main splitter
@@ -111,7 +255,7 @@ class ScreenshareGUI(QMainWindow):
         self.regions_label = QLabel("Regions: --")
         self.last_update_label = QLabel("Last: --")
         
-        ocr_layout.addWidget(QLabel("🎥"))
+        ocr_layout.addWidget(emoji_label("🎥"))
         ocr_layout.addWidget(self.fps_label)
         ocr_layout.addWidget(QLabel("|"))
         ocr_layout.addWidget(self.regions_label)
@@ -130,7 +274,8 @@ class ScreenshareGUI(QMainWindow):
         keystroke_frame = QFrame()
         keystroke_layout = QHBoxLayout(keystroke_frame)
         
-        self.keystroke_toggle = QCheckBox("🎹 Keystroke Logging")
+        self.keystroke_toggle = QCheckBox("Keystroke Logging")
+        self.keystroke_toggle.setIcon(QIcon(emoji_pixmap("🎹")))
         self.keystroke_toggle.toggled.connect(self.toggle_keystroke_logging)
         
         self.keystroke_status = QLabel("Disabled")
@@ -146,9 +291,10 @@ class ScreenshareGUI(QMainWindow):
         llm_frame = QFrame()
         llm_layout = QHBoxLayout(llm_frame)
         
-        self.llm_status = QLabel("🤖 LLM: Disconnected")
+        self.llm_status = QLabel("LLM: Disconnected")
         self.llm_model = QLabel(f"Model: {self.config.get('llm', {}).get('model', 'Unknown')}")
         
+        llm_layout.addWidget(emoji_label("🤖"))
         llm_layout.addWidget(self.llm_status)
         llm_layout.addWidget(QLabel("|"))
         llm_layout.addWidget(self.llm_model)
@@ -173,9 +319,16 @@ class ScreenshareGUI(QMainWindow):
         self.chat_display.setPlaceholderText("🤖 AI responses will appear here as screen content is analyzed...\n\n💡 Start Discord screenshare to begin OCR analysis")
         
         # Set font
-        font = QFont("Consolas", self.gui_config.get('font_size', 10))
+        font = QFont("Consolas", self.font_size)
         self.chat_display.setFont(font)
         
+        # Drop the oldest messages past this many so appends stay cheap in long sessions
+        self.chat_display.document().setMaximumBlockCount(self.chat_max_lines)
+        
+        # Cursor reused by _append_html to write at the end of the document
+        self._chat_cursor = self.chat_display.textCursor()
+        self._chat_vbar = self.chat_display.verticalScrollBar()
+        
         chat_layout.addWidget(self.chat_display)
         parent.addWidget(chat_group)
         
@@ -208,66 +361,19 @@ class ScreenshareGUI(QMainWindow):
         
     def setup_theme(self):
         """Apply dark theme"""
-        if self.gui_config.get('theme') == 'dark':
-            self.setStyleSheet("""
-                QMainWindow {
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                }
-                QGroupBox {
-                    font-weight: bold;
-                    border: 1px solid #555555;
-                    margin-top: 10px;
-                    padding-top: 10px;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px 0 5px;
-                }
-                QTextEdit {
-                    background-color: #1e1e1e;
-                    color: #ffffff;
-                    border: 1px solid #555555;
-                    selection-background-color: #0078d4;
-                }
-                QLineEdit {
-                    background-color: #1e1e1e;
-                    color: #ffffff;
-                    border: 1px solid #555555;
-                    padding: 5px;
-                }
-                QPushButton {
-                    background-color: #0078d4;
-                    color: #ffffff;
-                    border: none;
-                    padding: 5px 10px;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #106ebe;
-                }
-                QPushButton:pressed {
-                    background-color: #005a9e;
-                }
-                QLabel {
-                    color: #ffffff;
-                }
-                QCheckBox {
-                    color: #ffffff;
-                }
-                QProgressBar {
-                    border: 1px solid #555555;
-                    background-color: #1e1e1e;
-                }
-                QProgressBar::chunk {
-                    background-color: #0078d4;
-                }
-            """)
+        if self.theme == 'dark':
+            self.setStyleSheet(DARK_QSS)
+            
+            # The activity bar is colored by palette, which skips the QSS
+            # selector match and custom chunk drawing on every repaint
+            palette = self.ocr_progress.palette()
+            palette.setColor(QPalette.Highlight, QColor("#0078d4"))
+            palette.setColor(QPalette.Base, QColor("#1e1e1e"))
+            self.ocr_progress.setPalette(palette)
+            self.ocr_progress.setAutoFillBackground(True)
             
         # Set opacity
-        opacity = self.gui_config.get('opacity', 0.95)
-        self.setWindowOpacity(opacity)
+        self.setWindowOpacity(self.opacity)
         
     def setup_system_tray(self):
         """Setup system tray icon and menu"""
@@ -277,15 +383,22 @@ class ScreenshareGUI(QMainWindow):
         # Create tray icon
         self.tray_icon = QSystemTrayIcon(self)
         
-        # Create icon (simple text-based icon if no image available)
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(QColor(0, 120, 212))  # Blue color
-        icon = QIcon(pixmap)
-        self.tray_icon.setIcon(icon)
+        self.tray_icon.setIcon(get_tray_icon())
         
-        # Create tray menu
-        tray_menu = QMenu()
+        # Tray menu; its actions are only built the first time it opens
+        self.tray_menu = QMenu(self)
+        self.tray_menu.aboutToShow.connect(self.populate_tray_menu)
+        self.tray_icon.setContextMenu(self.tray_menu)
+        self.tray_icon.show()
         
+        # Tray icon click behavior
+        self.tray_icon.activated.connect(self.tray_icon_activated)
+        
+    def populate_tray_menu(self):
+        """Create the tray menu actions on first open"""
+        if not self.tray_menu.isEmpty():
+            return
+            
         show_action = QAction("Show Window", self)
         show_action.triggered.connect(self.show)
         
@@ -295,16 +408,10 @@ class ScreenshareGUI(QMainWindow):
         quit_action = QAction("Quit", self)
         quit_action.triggered.connect(self.close)
         
-        tray_menu.addAction(show_action)
-        tray_menu.addAction(hide_action)
-        tray_menu.addSeparator()
-        tray_menu.addAction(quit_action)
-        
-        self.tray_icon.setContextMenu(tray_menu)
-        self.tray_icon.show()
-        
-        # Tray icon click behavior
-        self.tray_icon.activated.connect(self.tray_icon_activated)
+        self.tray_menu.addAction(show_action)
+        self.tray_menu.addAction(hide_action)
+        self.tray_menu.addSeparator()
+        self.tray_menu.addAction(quit_action)
         
     def tray_icon_activated(self, reason):
         """Handle tray icon activation"""
@@ -324,6 +431,36 @@ class ScreenshareGUI(QMainWindow):
         """Set callback for keystroke logging toggle"""
         self.keystroke_toggle_callback = callback
         
+    def _hms(self) -> str:
+        """Current time as HH:MM:SS, formatted once per wall-clock second"""
+        sec = int(time.time())
+        if sec != self._last_ts_sec:
+            self._last_ts_sec = sec
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        return self._last_ts_str
+        
+    def _append_html(self, html: str, text: str = ""):
+        """Append a message as its own block with a single layout and repaint
+        
+        Only the short html prefix goes through Qt's rich-text parser; text
+        (queries, LLM output, OCR) is inserted verbatim as plain text.
+        """
+        # Follow new messages only if the user hasn't scrolled up to read
+        vbar = self._chat_vbar
+        at_bottom = vbar.value() >= vbar.maximum() - 4
+        
+        self.chat_display.setUpdatesEnabled(False)
+        self._chat_cursor.movePosition(QTextCursor.End)
+        if not self.chat_display.document().isEmpty():
+            self._chat_cursor.insertBlock()
+        self._chat_cursor.insertHtml(html)
+        if text:
+            self._chat_cursor.insertText(" " + text, QTextCharFormat())
+        self.chat_display.setUpdatesEnabled(True)
+        if at_bottom:
+            self.chat_display.setTextCursor(self._chat_cursor)
+            self.chat_display.ensureCursorVisible()
+        
     def send_user_query(self):
         """Send user query to LLM"""
         query = self.user_input.text().strip()
@@ -331,100 +468,135 @@ class ScreenshareGUI(QMainWindow):
             return
             
         # Display user query
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.chat_display.append(f"\n<b>[{timestamp}] 👤 You:</b> {query}")
+        timestamp = self._hms()
+        self._append_html(f"<b>[{timestamp}] 👤 You:</b>", query)
         
         # Clear input
         self.user_input.clear()
         
         # Send to LLM if callback is set
         if self.llm_query_callback:
-            threading.Thread(target=self._query_llm_thread, args=(query,), daemon=True).start()
+            self.query_pool.start(LLMQueryTask(self.llm_query_callback, query, self.signals))
         else:
             self.add_llm_response("❌ LLM not connected")
             
-    def _query_llm_thread(self, query: str):
-        """Query LLM in separate thread"""
-        try:
-            response = self.llm_query_callback(query)
-            if response:
-                self.signals.new_response.emit(response)
-            else:
-                self.signals.new_response.emit("❌ No response from LLM")
-        except Exception as e:
-            self.signals.new_response.emit(f"❌ LLM Error: {str(e)}")
-            
     def add_llm_response(self, response: str):
         """Add LLM response to chat display (thread-safe)"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.chat_display.append(f"\n<b>[{timestamp}] 🤖 AI:</b> {response}")
-        
-        # Auto-scroll to bottom
-        scrollbar = self.chat_display.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        timestamp = self._hms()
+        self._append_html(f"<b>[{timestamp}] 🤖 AI:</b>", response)
         
     def add_ocr_analysis(self, analysis: str):
         """Add OCR analysis to chat display"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.chat_display.append(f"\n<i>[{timestamp}] 👁️  OCR Analysis:</i> {analysis}")
-        
-        # Auto-scroll to bottom
-        scrollbar = self.chat_display.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
-        
-    def update_ocr_status(self, status: Dict):
-        """Update OCR status display"""
-        fps = status.get('fps', 0)
-        regions = status.get('active_regions', 0)
-        last_update = status.get('last_update', 0)
-        
-        self.fps_label.setText(f"FPS: {fps:.1f}")
-        self.regions_label.setText(f"Regions: {regions}")
-        
-        if last_update > 0:
-            seconds_ago = time.time() - last_update
-            if seconds_ago < 60:
-                self.last_update_label.setText(f"Last: {seconds_ago:.0f}s ago")
-            else:
-                self.last_update_label.setText(f"Last: {seconds_ago/60:.1f}m ago")
-        else:
-            self.last_update_label.setText("Last: Never")
+        timestamp = self._hms()
+        self._append_html(f"<i>[{timestamp}] 👁️  OCR Analysis:</i>", analysis)
+        
+    def update_ocr_status(self, status: Union[OcrStatus, Dict]):
+        """Queue an OCR status update; safe to call from any thread
+        
+        Only the newest status is kept and labels are redrawn at most ~30
+        times a second. The GUI thread is woken with an argument-less signal,
+        so the dict itself never goes through Qt's queued-signal marshalling.
+        Dicts are still accepted, with last_update as a time.time() value.
+        """
+        self._ocr_box.append(status)
+        if not self._ocr_scheduled:
+            self._ocr_scheduled = True
+            self.signals.ocr_pending.emit()
             
-        # Update progress bar based on activity
-        if seconds_ago < 5:
-            self.ocr_progress.setValue(100)
-        elif seconds_ago < 15:
-            self.ocr_progress.setValue(70)
-        elif seconds_ago < 30:
-            self.ocr_progress.setValue(40)
+    def _schedule_ocr_flush(self):
+        """Flush queued OCR status on the next frame"""
+        QTimer.singleShot(33, self._flush_ocr)
+            
+    def _flush_ocr(self):
+        """Update OCR status display from the latest queued status"""
+        # Clear the flag before taking the status so a concurrent post re-wakes us
+        self._ocr_scheduled = False
+        try:
+            status = self._ocr_box.popleft()
+        except IndexError:
+            return
+        
+        if isinstance(status, OcrStatus):
+            fps, regions, last_update = status
         else:
-            self.ocr_progress.setValue(10)
+            fps = status.get('fps', 0)
+            regions = status.get('active_regions', 0)
+            last_update = status.get('last_update', 0)
+            # Legacy dicts carry a time.time() stamp; rebase it onto perf_counter()
+            if last_update > 0:
+                last_update = time.perf_counter() - (time.time() - last_update)
+        
+        self._set_label(self.fps_label, f"FPS: {fps:.1f}")
+        self._set_label(self.regions_label, f"Regions: {regions}")
+        
+        self.last_ocr_update = last_update
+        self._refresh_age_labels()
             
         # Update LLM status
         if fps > 0:
-            self.llm_status.setText("🤖 LLM: Active")
+            self._set_label(self.llm_status, "LLM: Active")
+        else:
+            self._set_label(self.llm_status, "LLM: Idle")
+            
+    def _refresh_age_labels(self):
+        """Update the last-update age and activity bar from the stored OCR timestamp"""
+        if self.last_ocr_update <= 0:
+            self._set_label(self.last_update_label, "Last: Never")
+            self.ocr_progress.setValue(10)
+            return
+            
+        # last_update comes from time.perf_counter(), so wall-clock jumps can't skew it
+        seconds_ago = time.perf_counter() - self.last_ocr_update
+        if seconds_ago < 60:
+            self._set_label(self.last_update_label, f"Last: {seconds_ago:.0f}s ago")
         else:
-            self.llm_status.setText("🤖 LLM: Idle")
+            self._set_label(self.last_update_label, f"Last: {seconds_ago/60:.1f}m ago")
+            
+        # Update progress bar based on activity
+        for limit, value in PROGRESS_BUCKETS:
+            if seconds_ago < limit:
+                self.ocr_progress.setValue(value)
+                break
+            
+        # Keep ticking only while the seconds count is visible; a new update re-arms it
+        if seconds_ago < 60:
+            self.age_timer.start(1000)
+            
+    def _set_label(self, label: QLabel, text: str):
+        """Set a status label's text, skipping the relayout when it is unchanged"""
+        if self._label_text.get(id(label)) != text:
+            self._label_text[id(label)] = text
+            label.setText(text)
             
     def update_keystroke_status(self, status: Dict):
-        """Update keystroke logging status"""
+        """Queue a keystroke status update; coalesced like update_ocr_status"""
+        self._keystroke_pending = status
+        if not self._keystroke_scheduled:
+            self._keystroke_scheduled = True
+            QTimer.singleShot(33, self._flush_keystroke)
+            
+    def _flush_keystroke(self):
+        """Update keystroke logging status from the latest queued status"""
+        status, self._keystroke_pending = self._keystroke_pending, None
+        self._keystroke_scheduled = False
+        
         enabled = status.get('enabled', False)
         running = status.get('running', False)
         key_count = status.get('key_count', 0)
         
-        # Update checkbox without triggering signal
-        self.keystroke_toggle.blockSignals(True)
-        self.keystroke_toggle.setChecked(enabled and running)
-        self.keystroke_toggle.blockSignals(False)
+        # Update checkbox without triggering signal, and only when it changes
+        if self.keystroke_toggle.isChecked() != (enabled and running):
+            with QSignalBlocker(self.keystroke_toggle):
+                self.keystroke_toggle.setChecked(enabled and running)
         
         if enabled and running:
-            self.keystroke_status.setText("Active")
+            self._set_label(self.keystroke_status, "Active")
         elif enabled:
-            self.keystroke_status.setText("Enabled")
+            self._set_label(self.keystroke_status, "Enabled")
         else:
-            self.keystroke_status.setText("Disabled")
+            self._set_label(self.keystroke_status, "Disabled")
             
-        self.keystroke_counter.setText(f"Keys: {key_count}")
+        self._set_label(self.keystroke_counter, f"Keys: {key_count}")
         
     def toggle_keystroke_logging(self, checked: bool):
         """Toggle keystroke logging"""
@@ -434,13 +606,7 @@ class ScreenshareGUI(QMainWindow):
     def clear_chat(self):
         """Clear chat display"""
         self.chat_display.clear()
-        self.chat_display.append("💬 Chat cleared. Continue with your questions about screen content...")
-        
-    def refresh_status(self):
-        """Refresh status displays periodically"""
-        # This would normally be called by external status updates
-        # For now, just update the timestamp displays
-        pass
+        self._append_html("💬 Chat cleared. Continue with your questions about screen content...")
         
     def closeEvent(self, event):
         """Handle window close event"""
@@ -471,7 +637,8 @@ def main():
             "window_width": 450,
             "window_height": 600,
             "font_size": 10,
-            "opacity": 0.95
+            "opacity": 0.95,
+            "chat_max_lines": 2000
         },
         "llm": {
             "model": "llama3.2:latest"
@@ -491,11 +658,7 @@ def main():
     
     # Test status updates
     def update_test_status():
-        window.signals.ocr_update.emit({
-            'fps': 3.2,
-            'active_regions': 2,
-            'last_update': time.time()
-        })
+        window.update_ocr_status(OcrStatus(3.2, 2, time.perf_counter()))
         
         window.signals.keystroke_update.emit({
             'enabled': True,
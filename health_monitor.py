@@ -5,16 +5,48 @@ Tracks system health, performance metrics, and provides heartbeat monitoring
 """
 
 import json
+import os
 import time
 import threading
 import logging
 import psutil
+import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, Optional
 from logging.handlers import RotatingFileHandler
-import queue
-import subprocess
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    def json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+else:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def dir_size_bytes(root: str) -> int:
+    """Total size of the regular files under root, without following symlinks"""
+    total = 0
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    # DirEntry caches the type and, on most platforms, the stat from the directory read
+                    if entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue  # Directory vanished or unreadable (e.g. mid log rotation)
+    return total
 
 
 class HealthMonitor:
@@ -40,13 +72,23 @@ class HealthMonitor:
             'gui_active': False,
             'memory_usage': 0,
             'cpu_usage': 0,
+            'process_cpu_seconds': 0,
+            'thread_count': 0,
             'last_heartbeat': time.time()
         }
         
         # Threading
         self.running = False
         self.heartbeat_interval = self.config.get('heartbeat_interval', 5)
-        self.metrics_queue = queue.Queue()
+        # Latest (value, monotonic timestamp) per metric since the last heartbeat;
+        # repeated updates to a key overwrite each other, so the heartbeat applies
+        # one per key
+        self._pending_metrics: Dict[str, tuple] = {}
+        self._pending_lock = threading.Lock()
+        
+        # Monotonic time each metric was last updated. Interval and staleness
+        # math uses these; wall-clock values are only written to the health file
+        self.metric_update_times: Dict[str, float] = {}
         
         # Setup logging
         self.setup_logging()
@@ -56,6 +98,44 @@ class HealthMonitor:
         self.min_fps_threshold = self.config.get('min_fps_threshold', 1.0)
         self.max_queue_depth = self.config.get('max_queue_depth', 50)
         
+        # Health file document, built once; 'metrics' aliases self.metrics and
+        # each heartbeat only refreshes the per-write fields
+        self.health_data = {
+            'timestamp': 0,
+            'datetime': None,
+            'health_score': 0,
+            'metrics': self.metrics,
+            'thresholds': {
+                'max_stale_seconds': self.max_stale_seconds,
+                'min_fps_threshold': self.min_fps_threshold,
+                'max_queue_depth': self.max_queue_depth
+            },
+            'status': {}
+        }
+        
+        # CPU percent is measured against the previous call; prime it so the
+        # first heartbeat gets a real reading without blocking
+        psutil.cpu_percent(interval=None)
+        self.process = psutil.Process()
+        self._last_usage_sample = 0.0
+        self.min_sample_interval = 1.0
+        
+        # Ollama liveness probe: one kept-alive connection, checked every
+        # llm_probe_interval seconds rather than on every heartbeat
+        self.ollama_url = "http://127.0.0.1:11434/api/version"
+        self.llm_probe_interval = self.config.get('llm_probe_interval', 30)
+        self._last_llm_probe = float('-inf')
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0))
+        
+        # Slow-changing metrics (log disk usage) are collected at most every
+        # slow_metric_interval seconds; CPU/memory every heartbeat
+        self.slow_metric_interval = self.config.get('slow_metric_interval', 60)
+        self._last_slow_collect = float('-inf')
+        
+        # Health status is logged once a minute
+        self._next_status_log = time.monotonic() + 60
+        
     def setup_logging(self):
         """Setup health monitoring logging"""
         log_dir = Path.home() / ".local/share/screenshare-assistant/logs"
@@ -92,88 +172,113 @@ class HealthMonitor:
         
     def update_metric(self, key: str, value: Any):
         """Update a metric value (thread-safe)"""
-        try:
-            self.metrics_queue.put((key, value, time.time()), block=False)
-        except queue.Full:
-            # Queue full, skip this update
-            pass
+        with self._pending_lock:
+            self._pending_metrics[key] = (value, time.monotonic())
     
     def process_metric_updates(self):
-        """Process queued metric updates"""
-        updates_processed = 0
-        
-        while not self.metrics_queue.empty() and updates_processed < 100:
-            try:
-                key, value, timestamp = self.metrics_queue.get(block=False)
-                self.metrics[key] = value
-                self.metrics['last_update'] = timestamp
-                updates_processed += 1
-            except queue.Empty:
-                break
+        """Apply the metric updates queued since the last heartbeat"""
+        with self._pending_lock:
+            pending, self._pending_metrics = self._pending_metrics, {}
+        
+        for key, (value, timestamp) in pending.items():
+            self.metrics[key] = value
+            self.metric_update_times[key] = timestamp
+        if pending:
+            # Reported as wall-clock time for readers of the health file
+            latest = max(timestamp for _, timestamp in pending.values())
+            self.metrics['last_update'] = time.time() - (time.monotonic() - latest)
                 
-        return updates_processed
+        return len(pending)
     
     def collect_system_metrics(self):
         """Collect system performance metrics"""
         try:
-            # CPU and memory usage
-            self.metrics['cpu_usage'] = psutil.cpu_percent(interval=0.1)
-            
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            self.metrics['memory_usage'] = memory_info.rss / 1024 / 1024  # MB
+            now = time.monotonic()
+            self.collect_fast_metrics(now)
             
-            # Disk usage for log directory
-            log_dir = Path.home() / ".local/share/screenshare-assistant/logs"
-            if log_dir.exists():
-                disk_usage = sum(f.stat().st_size for f in log_dir.rglob('*') if f.is_file())
-                self.metrics['log_disk_usage'] = disk_usage / 1024 / 1024  # MB
-            
-            # Network connectivity (check if Ollama is reachable)
-            try:
-                result = subprocess.run([
-                    'curl', '-s', '--connect-timeout', '2', 
-                    'http://localhost:11434/api/version'
-                ], capture_output=True, timeout=3)
-                self.metrics['llm_connectivity'] = result.returncode == 0
-            except:
-                self.metrics['llm_connectivity'] = False
+            # Disk and LLM connectivity change slowly; skip them between intervals
+            if now - self._last_slow_collect >= self.slow_metric_interval:
+                self._last_slow_collect = now
+                self.collect_log_disk_usage()
+            if now - self._last_llm_probe >= self.llm_probe_interval:
+                self._last_llm_probe = now
+                self.probe_llm_connectivity()
                 
         except Exception as e:
             self.logger.error(f"Failed to collect system metrics: {e}")
+            
+    def collect_fast_metrics(self, now: float):
+        """CPU and memory usage, refreshed every heartbeat"""
+        # Non-blocking; back-to-back calls (e.g. the final write in stop())
+        # reuse the last sample
+        if now - self._last_usage_sample < self.min_sample_interval:
+            return
+        self._last_usage_sample = now
+        self.metrics['cpu_usage'] = psutil.cpu_percent(interval=None)
+        
+        # oneshot() reads /proc/<pid> once for all the per-process fields
+        with self.process.oneshot():
+            memory_info = self.process.memory_info()
+            cpu_times = self.process.cpu_times()
+            thread_count = self.process.num_threads()
+        self.metrics['memory_usage'] = memory_info.rss / 1024 / 1024  # MB
+        self.metrics['process_cpu_seconds'] = cpu_times.user + cpu_times.system
+        self.metrics['thread_count'] = thread_count
+        
+    def collect_log_disk_usage(self):
+        """Disk usage for log directory"""
+        log_dir = Path.home() / ".local/share/screenshare-assistant/logs"
+        if log_dir.exists():
+            disk_usage = dir_size_bytes(str(log_dir))
+            self.metrics['log_disk_usage'] = disk_usage / 1024 / 1024  # MB
+            
+    def probe_llm_connectivity(self):
+        """Network connectivity (check if Ollama is reachable)"""
+        try:
+            response = self.session.get(self.ollama_url, timeout=(0.5, 2))
+            self.metrics['llm_connectivity'] = response.status_code == 200
+        except requests.RequestException:
+            self.metrics['llm_connectivity'] = False
+    
+    def ocr_staleness(self) -> float:
+        """Seconds since the last OCR update was received (inf if none yet)"""
+        last_ocr = self.metric_update_times.get('last_ocr_time')
+        if last_ocr is None:
+            return float('inf')
+        return time.monotonic() - last_ocr
     
     def calculate_health_score(self) -> float:
         """Calculate overall health score (0-100)"""
         score = 100.0
-        current_time = time.time()
+        metrics = self.metrics
         
         # OCR freshness penalty
-        ocr_staleness = current_time - self.metrics.get('last_ocr_time', 0)
+        ocr_staleness = self.ocr_staleness()
         if ocr_staleness > self.max_stale_seconds:
             score -= min(50, ocr_staleness / self.max_stale_seconds * 25)
         
         # FPS penalty
-        current_fps = self.metrics.get('current_fps', 0)
+        current_fps = metrics.get('current_fps', 0)
         if current_fps < self.min_fps_threshold:
             score -= 20
         
         # Queue depth penalty
-        queue_depth = self.metrics.get('queue_depth', 0)
+        queue_depth = metrics.get('queue_depth', 0)
         if queue_depth > self.max_queue_depth:
             score -= 15
         
         # Memory usage penalty (if over 500MB)
-        memory_usage = self.metrics.get('memory_usage', 0)
+        memory_usage = metrics.get('memory_usage', 0)
         if memory_usage > 500:
             score -= min(10, (memory_usage - 500) / 100 * 5)
         
         # CPU usage penalty (if over 80%)
-        cpu_usage = self.metrics.get('cpu_usage', 0)
+        cpu_usage = metrics.get('cpu_usage', 0)
         if cpu_usage > 80:
             score -= min(10, (cpu_usage - 80) / 20 * 10)
         
         # LLM connectivity bonus/penalty
-        if self.metrics.get('llm_connectivity', False):
+        if metrics.get('llm_connectivity', False):
             score += 5
         else:
             score -= 10
@@ -192,33 +297,27 @@ class HealthMonitor:
             # Calculate health score
             health_score = self.calculate_health_score()
             
-            # Build health data
-            health_data = {
-                'timestamp': time.time(),
-                'datetime': datetime.now().isoformat(),
-                'health_score': health_score,
-                'metrics': self.metrics.copy(),
-                'thresholds': {
-                    'max_stale_seconds': self.max_stale_seconds,
-                    'min_fps_threshold': self.min_fps_threshold,
-                    'max_queue_depth': self.max_queue_depth
-                },
-                'status': self.get_status_summary()
-            }
-            
-            # Update heartbeat
-            self.metrics['last_heartbeat'] = time.time()
-            health_data['metrics']['last_heartbeat'] = self.metrics['last_heartbeat']
+            # Update heartbeat and the per-write fields of the health document
+            now = time.time()
+            self.metrics['last_heartbeat'] = now
+            health_data = self.health_data
+            health_data['timestamp'] = now
+            health_data['datetime'] = datetime.fromtimestamp(now).isoformat()
+            health_data['health_score'] = health_score
+            health_data['status'] = self.get_status_summary()
             
             # Write to file atomically
             temp_file = self.health_file.with_suffix('.tmp')
-            with open(temp_file, 'w') as f:
-                json.dump(health_data, f, indent=2)
+            data = json_dumps(health_data)
+            with open(temp_file, 'wb', buffering=0) as f:
+                f.write(data)
             
             temp_file.replace(self.health_file)
             
             # Log health status periodically
-            if int(time.time()) % 60 == 0:  # Every minute
+            now_mono = time.monotonic()
+            if now_mono >= self._next_status_log:  # Every minute
+                self._next_status_log = now_mono + 60
                 self.logger.info(f"Health score: {health_score:.1f}, "
                                f"FPS: {self.metrics.get('current_fps', 0):.1f}, "
                                f"Memory: {self.metrics.get('memory_usage', 0):.1f}MB")
@@ -228,8 +327,7 @@ class HealthMonitor:
     
     def get_status_summary(self) -> Dict[str, str]:
         """Get human-readable status summary"""
-        current_time = time.time()
-        ocr_staleness = current_time - self.metrics.get('last_ocr_time', 0)
+        ocr_staleness = self.ocr_staleness()
         
         return {
             'ocr_status': 'active' if ocr_staleness < 10 else 'stale' if ocr_staleness < 30 else 'dead',
@@ -277,6 +375,7 @@ class HealthMonitor:
         # Wait for thread to finish
         if hasattr(self, 'heartbeat_thread'):
             self.heartbeat_thread.join(timeout=2)
+        self.session.close()
         
         self.logger.info("Health monitor stopped")
     
@@ -12,6 +12,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Callable, Any
 from dataclasses import dataclass, asdict
+from functools import cached_property
 from queue import Queue, Empty
 import logging
 
@@ -46,6 +47,11 @@ class ScreenContext:
     active_regions: List[Dict[str, int]]
     session_stats: Dict[str, Any]
     
+    @cached_property
+    def recent_activity(self) -> str:
+        """Last three changes joined for prompts, built once per context"""
+        return " -> ".join(self.recent_changes[-3:])
+    
     def to_dict(self) -> Dict:
         return asdict(self)
     
@@ -424,7 +430,7 @@ def openai_integration_example(bridge: LLMOCRBridge):
         prompt = f"""
         Current screen content: {context.current_text}
         
-        Recent changes: {' -> '.join(context.recent_changes[-3:])}
+        Recent changes: {context.recent_activity}
         
         Session stats: {context.session_stats}
         
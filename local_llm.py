@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Local LLM Module
+In-process local model hook used by the Discord LLM assistant
+"""
+
+
+def analyze(prompt: str) -> str:
+    """Analyze a prompt with the local model"""
+    # Placeholder for local LLM integration
+    # Replace with calls into your local model (loaded once, at import time)
+    return ("Local LLM analysis: User appears to be working with text content.\n"
+            "Suggestion: Consider using OCR confidence scores for better accuracy.")
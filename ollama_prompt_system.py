@@ -6,6 +6,7 @@ Context-aware prompts, premade responses, and guided questions for enhanced AI a
 
 import json
 import time
+import threading
 import requests
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
@@ -55,6 +56,7 @@ class OllamaPromptSystem:
         self.config = self.load_config()
         self.session_context = {}
         self.response_history = []
+        self._history_lock = threading.Lock()
         
         # Load prompt templates
         self.prompt_templates = self.load_prompt_templates()
@@ -647,10 +649,11 @@ Focus on actionable productivity advice."""
             timestamp=time.time()
         )
         
-        # Store response in history
-        self.response_history.append(response)
-        if len(self.response_history) > 50:  # Keep last 50 responses
-            self.response_history = self.response_history[-50:]
+        # Store response in history (analyze_content may run on several threads)
+        with self._history_lock:
+            self.response_history.append(response)
+            if len(self.response_history) > 50:  # Keep last 50 responses
+                self.response_history = self.response_history[-50:]
         
         return response
     
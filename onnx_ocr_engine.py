@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+ONNX Runtime OCR Engine
+Drop-in alternative to WorkingFastScreenOCR backed by OnnxTR detection + recognition models
+"""
+
+from typing import List, Optional, Union
+
+import numpy as np
+from PIL import Image
+
+try:
+    import onnxruntime as ort
+    from onnxtr.models import EngineConfig, ocr_predictor
+    ONNX_OCR_AVAILABLE = True
+except ImportError:
+    ONNX_OCR_AVAILABLE = False
+
+
+class OnnxOCREngine:
+    """Screen OCR using fused, int8-quantized ONNX models (CUDA when available, else CPU)"""
+
+    # Frames per inference call when captures arrive faster than OCR drains them
+    batch_size = 4
+
+    def __init__(self, det_arch: str = "db_mobilenet_v3_large", reco_arch: str = "crnn_vgg16_bn",
+                 quantized: bool = True):
+        if not ONNX_OCR_AVAILABLE:
+            raise RuntimeError("onnxruntime/onnxtr not available")
+
+        # Single intra-op thread: one frame at a time, same reasoning as OMP_THREAD_LIMIT=1
+        so = ort.SessionOptions()
+        so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        so.intra_op_num_threads = 1
+        # Keep per-run buffers in the arena and replay the first run's allocation plan
+        so.enable_cpu_mem_arena = True
+        so.enable_mem_pattern = True
+
+        # CPU: grow the arena only by what a run asks for. CUDA: copy inputs on the
+        # compute stream and skip exhaustive cuDNN searches for each new crop shape
+        providers = [("CPUExecutionProvider", {"arena_extend_strategy": "kSameAsRequested"})]
+        if "CUDAExecutionProvider" in ort.get_available_providers():
+            providers.insert(0, ("CUDAExecutionProvider", {
+                "arena_extend_strategy": "kNextPowerOfTwo",
+                "cudnn_conv_algo_search": "DEFAULT",
+                "do_copy_in_default_stream": True
+            }))
+        engine_cfg = EngineConfig(providers=providers, session_options=so)
+
+        self.predictor = ocr_predictor(
+            det_arch=det_arch,
+            reco_arch=reco_arch,
+            det_engine_cfg=engine_cfg,
+            reco_engine_cfg=engine_cfg,
+            load_in_8_bit=quantized
+        )
+
+    def configure(self, width: int, height: int):
+        """Warm up the sessions on a blank frame of the capture size
+        
+        The first inference sizes ORT's buffers and arenas; doing it here keeps
+        that cost off the first real frame.
+        """
+        self.predictor([np.zeros((height, width, 3), dtype=np.uint8)])
+
+    def _to_rgb_array(self, image: Union[Image.Image, str, np.ndarray]) -> np.ndarray:
+        """Convert a path, PIL image or numpy frame to the RGB array the predictor takes"""
+        if isinstance(image, str):
+            image = Image.open(image)
+        elif isinstance(image, np.ndarray):
+            image = Image.fromarray(image)
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        return np.asarray(image)
+
+    def extract_screen_text(self, image: Union[Image.Image, str, np.ndarray]) -> Optional[str]:
+        """Extract text from a screen capture"""
+        return self.extract_screen_text_batch([image])[0]
+
+    def extract_screen_text_batch(self, images: List[Union[Image.Image, str, np.ndarray]]) -> List[Optional[str]]:
+        """Extract text from several captures in one batched inference call"""
+        try:
+            result = self.predictor([self._to_rgb_array(image) for image in images])
+            return [page.render().strip() or None for page in result.pages]
+
+        except Exception as e:
+            print(f"⚠️ ONNX OCR error: {e}")
+            return [None] * len(images)
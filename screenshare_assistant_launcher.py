@@ -17,7 +17,7 @@ from typing import Dict, Optional
 sys.path.insert(0, str(Path(__file__).parent))
 
 try:
-    from gui_chat_window import ScreenshareGUI, QApplication
+    from gui_chat_window import ScreenshareGUI, OcrStatus, QApplication
     from llm_ocr_bridge import LLMOCRBridge, ScreenContext, OCRFrame
     from keystroke_logger import KeystrokeLogger
     from health_monitor import HealthMonitor
@@ -177,12 +177,12 @@ class ScreenshareAssistant:
         
         # Update GUI status
         if self.gui:
-            status_update = {
-                'fps': context.session_stats.get('frames_per_minute', 0) / 60,
-                'active_regions': len(context.active_regions),
-                'last_update': time.time()
-            }
-            self.gui.signals.ocr_update.emit(status_update)
+            status_update = OcrStatus(
+                context.session_stats.get('frames_per_minute', 0) / 60,
+                len(context.active_regions),
+                time.perf_counter()
+            )
+            self.gui.update_ocr_status(status_update)
         
         # Analyze context with LLM periodically
         if len(context.recent_changes) >= 3 and context.current_text:
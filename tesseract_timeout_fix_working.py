@@ -14,6 +14,23 @@ from PIL import Image
 import pytesseract
 import psutil
 
+
+def cpu_has_avx2() -> bool:
+    """Whether the CPU supports AVX2, which Tesseract's LSTM engine is built to use"""
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                if line.startswith('flags'):
+                    return 'avx2' in line.split()
+    except OSError:
+        pass
+        
+    try:
+        import cpuinfo
+        return 'avx2' in cpuinfo.get_cpu_info().get('flags', [])
+    except Exception:
+        return True  # Unknown platform; assume a modern CPU
+
 class TesseractTimeoutManager:
     """Thread-based timeout manager for Tesseract OCR operations"""
     
@@ -153,21 +170,55 @@ class WorkingFastScreenOCR:
         # Note: Avoid including quote characters (" and ') in whitelist as Tesseract's
         # argument/config parsing may treat them specially and error with
         # "No closing quotation". Keep a safe, punctuation-heavy whitelist instead.
-        self.tesseract_config = '--oem 3 --psm 8 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.,!?;:()[]{}@#$/%&*+=<>~_-'
+        self.tesseract_config = '--oem 3 --psm 6 -c preserve_interword_spaces=1 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.,!?;:()[]{}@#$/%&*+=<>~_-'
+        
+        # LSTM-only (--oem 1) with the fast eng model (Debian/Ubuntu's tesseract-ocr-eng
+        # ships tessdata_fast) is quickest on AVX2 CPUs; otherwise let Tesseract pick
+        if cpu_has_avx2():
+            self.tesseract_config = self.tesseract_config.replace('--oem 3', '--oem 1 -l eng', 1)
+        else:
+            print("⚠️ CPU lacks AVX2 - Tesseract LSTM OCR will be slow")
+        self._base_config = self.tesseract_config
+        
+        # Frame size set by configure() and the resize precomputed for it
+        self._frame_size = None
+        self._frame_resize = None
         
-    def _preprocess_for_speed(self, image: Union[Image.Image, str]) -> Image.Image:
+    def _fit_size(self, width: int, height: int) -> Optional[tuple]:
+        """Downscaled size for frames over 1500px, or None to keep as is"""
+        if width > 1500 or height > 1500:
+            ratio = min(1500 / width, 1500 / height)
+            return (int(width * ratio), int(height * ratio))
+        return None
+        
+    def configure(self, width: int, height: int, dpi: int = 96):
+        """Specialize for a fixed capture size
+        
+        Screen captures carry no resolution, so Tesseract otherwise estimates
+        one for every frame; the resize for this size is worked out once.
+        """
+        self.tesseract_config = f"{self._base_config} --dpi {dpi}"
+        self._frame_size = (width, height)
+        self._frame_resize = self._fit_size(width, height)
+        
+    def _preprocess_for_speed(self, image: Union[Image.Image, str, Any]) -> Image.Image:
         """Fast preprocessing for screen captures"""
         if isinstance(image, str):
             image = Image.open(image)
+        elif not isinstance(image, Image.Image):
+            # uint8 numpy array (H, W) or (H, W, 3); wrapped without copying
+            image = Image.fromarray(image)
         
         # Convert to grayscale for speed
         if image.mode != 'L':
             image = image.convert('L')
         
         # Aggressive resizing for speed
-        if image.width > 1500 or image.height > 1500:
-            ratio = min(1500 / image.width, 1500 / image.height)
-            new_size = (int(image.width * ratio), int(image.height * ratio))
+        if image.size == self._frame_size:
+            new_size = self._frame_resize
+        else:
+            new_size = self._fit_size(image.width, image.height)
+        if new_size:
             image = image.resize(new_size, Image.Resampling.NEAREST)
         
         return image
@@ -176,8 +227,8 @@ class WorkingFastScreenOCR:
         """Fast OCR operation for screen text"""
         return pytesseract.image_to_string(image, config=self.tesseract_config).strip()
     
-    def extract_screen_text(self, image: Union[Image.Image, str]) -> Optional[str]:
-        """Extract text optimized for screen captures"""
+    def extract_screen_text(self, image: Union[Image.Image, str, Any]) -> Optional[str]:
+        """Extract text optimized for screen captures (PIL image, file path or numpy array)"""
         try:
             # Fast preprocessing
             processed_image = self._preprocess_for_speed(image)